@@ -0,0 +1,86 @@
+"""Shared helpers for the diagnostic scripts."""
+
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from functools import cache
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+from pyintellicenter import ICBaseController, ICModelController
+
+# Connection settings live in the repository root, next to pyproject.toml
+ENV_PATH = Path(__file__).resolve().parent.parent / ".env"
+
+# Hardware definitions fetched in this process, keyed by (host, sw_version)
+_hardware_definitions = {}
+
+
+@cache
+def env():
+    """Return the (host, port) of the IntelliCenter, loading .env only once."""
+    load_dotenv(ENV_PATH)
+    host = os.getenv("INTELLICENTER_HOST", "10.100.11.60")
+    port = int(os.getenv("INTELLICENTER_PORT", "6681"))
+    return host, port
+
+
+@asynccontextmanager
+async def connected_controller(model=None):
+    """Connect to the IntelliCenter configured in the environment.
+
+    Yields an ICModelController when a PoolModel is given, otherwise a plain
+    ICBaseController. The connection is closed when the context exits.
+    """
+    host, port = env()
+
+    print(f"Connecting to IntelliCenter at {host}:{port}...")
+
+    if model is not None:
+        controller = ICModelController(host, model, port)
+    else:
+        controller = ICBaseController(host, port)
+
+    try:
+        await controller.start()
+        print(f"Connected to: {controller.system_info.prop_name}\n")
+        yield controller
+    finally:
+        await controller.stop()
+
+
+async def get_hardware_definition(controller):
+    """Return the panel's hardware definition, fetching it at most once.
+
+    The definition is large and only changes with the panel configuration,
+    so scripts run together via run_all.py share a single copy. A firmware
+    update changes sw_version and therefore triggers a fresh fetch.
+    """
+    key = (controller.host, controller.system_info.sw_version)
+    if key not in _hardware_definitions:
+        _hardware_definitions[key] = await controller.get_hardware_definition()
+    return _hardware_definitions[key]
+
+
+def real_values(params):
+    """Return the (key, value) pairs of params that hold a real value, sorted by key.
+
+    IntelliCenter echoes the key as the value for attributes an object does
+    not have; those are filtered out before sorting.
+    """
+    items = [(k, v) for k, v in params.items() if v is not None and v != k]
+    items.sort()
+    return items
+
+
+def run(main):
+    """Run a script's main() coroutine, on uvloop when it is installed.
+
+    Returns whatever main() returns, e.g. an exit code for sys.exit().
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main())
+    return asyncio.run(main(), loop_factory=uvloop.new_event_loop)
@@ -1,242 +1,267 @@
 #!/usr/bin/env python3
 """Discover ALL attributes by querying with empty keys (returns everything)."""
 
-import asyncio
-import os
+import sys
 
-from dotenv import load_dotenv
+from _common import connected_controller, run
 
-load_dotenv()
+from pyintellicenter.attributes import ALL_ATTRIBUTES_BY_TYPE, ATTR_TO_TYPES
 
-from pyintellicenter import ICBaseController  # noqa: E402
-from pyintellicenter.attributes import ALL_ATTRIBUTES_BY_TYPE  # noqa: E402
+# Identity attributes that are never listed in the tracked attribute sets
+_IGNORED: frozenset[str] = frozenset({"OBJTYP", "HNAME", "OBJNAM"})
+_EMPTY: frozenset[str] = frozenset()
 
-
-async def main():
-    host = os.getenv("INTELLICENTER_HOST", "10.100.11.60")
-    port = int(os.getenv("INTELLICENTER_PORT", "6681"))
-
-    print(f"Connecting to IntelliCenter at {host}:{port}...")
-
-    controller = ICBaseController(host, port)
-
-    try:
-        await controller.start()
-        print(f"Connected to: {controller.system_info.prop_name}\n")
-
-        # Object types to check
-        object_types = [
+# Massive list of potential attribute names; dict.fromkeys drops duplicates
+# while keeping the original order.
+_ALL_KEYS: tuple[str, ...] = tuple(
+    dict.fromkeys(
+        [
+            "OBJTYP",
+            "SUBTYP",
+            "OBJNAM",
+            "HNAME",
+            "SNAME",
+            "PARENT",
             "BODY",
+            "STATUS",
+            "MODE",
+            "TEMP",
+            "LOTMP",
+            "HITMP",
+            "LSTTMP",
+            "HTMODE",
+            "HTSRC",
+            "BOOST",
+            "READY",
+            "STATIC",
+            "MANUAL",
+            "FILTER",
+            "SELECT",
             "CIRCUIT",
-            "PUMP",
             "HEATER",
-            "CHEM",
-            "SENSE",
-            "SCHED",
-            "VALVE",
-            "CIRCGRP",
-            "PMPCIRC",
-            "REMOTE",
-            "REMBTN",
-            "EXTINSTR",
+            "VOL",
+            "LISTORD",
+            "PRIM",
+            "SEC",
+            "SPEED",
+            "ACT1",
+            "ACT2",
+            "ACT3",
+            "ACT4",
+            "SHARE",
             "FEATR",
-            "PRESS",
-            "SYSTEM",
+            "USE",
+            "LIMIT",
+            "TIME",
+            "TIMOUT",
+            "DNTSTP",
+            "FREEZE",
+            "CHILD",
+            "SWIM",
+            "SYNC",
+            "SET",
+            "DLY",
+            "GPM",
+            "RPM",
+            "PWR",
+            "MIN",
+            "MAX",
+            "MINF",
+            "MAXF",
+            "PRIMFLO",
+            "PRIMTIM",
+            "PRIOR",
+            "SETTMP",
+            "SETTMPNC",
             "SYSTIM",
-            "PANEL",
-            "MODULE",
+            "NAME",
+            "OBJLIST",
+            "CALIB",
+            "PROBE",
+            "SOURCE",
+            "ASSIGN",
+            "PHVAL",
+            "PHSET",
+            "PHHI",
+            "PHLO",
+            "PHTNK",
+            "ORPVAL",
+            "ORPSET",
+            "ORPHI",
+            "ORPLO",
+            "ORPTNK",
+            "SALT",
+            "ALK",
+            "CALC",
+            "CYACID",
+            "QUALTY",
+            "SINDEX",
+            "SUPER",
+            "CHLOR",
+            "COMUART",
+            "VER",
+            "PROPNAME",
+            "ADDRESS",
+            "CITY",
+            "STATE",
+            "ZIP",
+            "COUNTRY",
+            "EMAIL",
+            "EMAIL2",
+            "PHONE",
+            "PHONE2",
+            "LOCX",
+            "LOCY",
+            "PASSWRD",
+            "SERVICE",
+            "VACFLO",
+            "MANHT",
+            "HEATING",
+            "VALVE",
+            "AVAIL",
+            "DAY",
+            "CLK24A",
+            "TIMZON",
+            "DLSTIM",
+            "SINGLE",
+            "START",
+            "STOP",
+            "SMTSRT",
+            "UPDATE",
+            "GROUP",
+            "COOLING",
+            "VACFLO",
+            "VACTIM",
+            "COOL",
             "PERMIT",
+            "SHOMNU",
+            "ENABLE",
+            "CIRCUITS",
+            "PORT",
+            "NORMAL",
+            "ACT",
         ]
+    )
+)
+
+
+# Object types to check
+_OBJECT_TYPES = (
+    "BODY",
+    "CIRCUIT",
+    "PUMP",
+    "HEATER",
+    "CHEM",
+    "SENSE",
+    "SCHED",
+    "VALVE",
+    "CIRCGRP",
+    "PMPCIRC",
+    "REMOTE",
+    "REMBTN",
+    "EXTINSTR",
+    "FEATR",
+    "PRESS",
+    "SYSTEM",
+    "SYSTIM",
+    "PANEL",
+    "MODULE",
+    "PERMIT",
+)
+
+# Per-type probe keys: only candidates not already tracked for that type, so
+# the report doesn't list attributes we know about.
+_PROBE_KEYS_BY_TYPE: dict[str, frozenset[str]] = {
+    objtype: frozenset(_ALL_KEYS).difference(_IGNORED, ALL_ATTRIBUTES_BY_TYPE.get(objtype, _EMPTY))
+    for objtype in _OBJECT_TYPES
+}
+
+# Keys for the single query: OBJTYP to split the results by type, plus every
+# candidate that is untracked on at least one type. Candidates tracked on all
+# types are left out, so the controller doesn't echo them back.
+_QUERY_KEYS: list[str] = ["OBJTYP"] + [
+    key for key in _ALL_KEYS if any(key in keys for keys in _PROBE_KEYS_BY_TYPE.values())
+]
+
+
+async def main(controller=None):
+    if controller is None:
+        async with connected_controller() as controller:
+            await main(controller)
+        return
+
+    all_discovered: dict[str, set[str]] = {t: set() for t in _OBJECT_TYPES}
+    obj_counts: dict[str, int] = dict.fromkeys(_OBJECT_TYPES, 0)
+
+    print("Querying all object types...", end=" ", flush=True)
+
+    # Get every object with all attributes we don't already track in a single
+    # round-trip. GetParamList only accepts one condition and one key list per
+    # request, so query unconditionally with the union of the per-type probe
+    # keys and keep each type's own keys from the results.
+    response = await controller.send_cmd(
+        "GetParamList",
+        {
+            "condition": "",
+            "objectList": [{"objnam": "INCR", "keys": _QUERY_KEYS}],
+        },
+    )
+    print(f"{len(response.get('objectList', []))} objects")
+
+    for obj in response.get("objectList", []):
+        params = obj.get("params", {})
+        objtype = params.get("OBJTYP")
+        probe_keys = _PROBE_KEYS_BY_TYPE.get(objtype)
+        if probe_keys is None:
+            continue
+        obj_counts[objtype] += 1
+        discovered_attrs = all_discovered[objtype]
+        for key, value in params.items():
+            # Only count if the value is different from the key
+            # (key=value means attribute doesn't exist)
+            if key in probe_keys and value is not None and value != key:
+                discovered_attrs.add(key)
+
+    # Build the report in memory and write it out in one go
+    out: list[str] = []
+    for objtype in _OBJECT_TYPES:
+        out.append(
+            f"  {objtype}: {obj_counts[objtype]} objects, "
+            f"{len(all_discovered[objtype])} untracked attrs with values"
+        )
+
+    # Now compare with what we track
+    out.append("\n" + "=" * 70)
+    out.append("DISCOVERY RESULTS: Attributes with real values")
+    out.append("=" * 70)
+
+    total_new = 0
+
+    for objtype in sorted(all_discovered.keys()):
+        discovered = all_discovered[objtype]
+        tracked = ALL_ATTRIBUTES_BY_TYPE.get(objtype, _EMPTY)
+
+        # Find attributes we discovered but don't track
+        new_attrs = discovered.difference(tracked, _IGNORED)
+
+        if new_attrs:
+            out.append(f"\n{objtype}: {len(new_attrs)} NEW attributes found!")
+            for attr in sorted(new_attrs):
+                # Point out attributes already tracked on other object types
+                elsewhere = ATTR_TO_TYPES.get(attr)
+                if elsewhere:
+                    out.append(f"  + {attr} (tracked on {', '.join(elsewhere)})")
+                else:
+                    out.append(f"  + {attr}")
+            total_new += len(new_attrs)
+
+    if total_new == 0:
+        out.append("\n✓ No new attributes discovered - we're tracking everything!")
+    else:
+        out.append(f"\nTotal: {total_new} new attributes to consider adding")
 
-        all_discovered: dict[str, set[str]] = {}
-
-        for objtype in object_types:
-            print(f"Querying {objtype}...", end=" ", flush=True)
-
-            # Get all objects of this type with ALL their attributes
-            # by using a huge list of potential attribute names
-            response = await controller.send_cmd(
-                "GetParamList",
-                {
-                    "condition": f"OBJTYP={objtype}",
-                    "objectList": [
-                        {
-                            "objnam": "INCR",
-                            "keys": [
-                                # Request a massive list of potential attributes
-                                "OBJTYP",
-                                "SUBTYP",
-                                "OBJNAM",
-                                "HNAME",
-                                "SNAME",
-                                "PARENT",
-                                "BODY",
-                                "STATUS",
-                                "MODE",
-                                "TEMP",
-                                "LOTMP",
-                                "HITMP",
-                                "LSTTMP",
-                                "HTMODE",
-                                "HTSRC",
-                                "BOOST",
-                                "READY",
-                                "STATIC",
-                                "MANUAL",
-                                "FILTER",
-                                "SELECT",
-                                "CIRCUIT",
-                                "HEATER",
-                                "VOL",
-                                "LISTORD",
-                                "PRIM",
-                                "SEC",
-                                "SPEED",
-                                "ACT1",
-                                "ACT2",
-                                "ACT3",
-                                "ACT4",
-                                "SHARE",
-                                "FEATR",
-                                "USE",
-                                "LIMIT",
-                                "TIME",
-                                "TIMOUT",
-                                "DNTSTP",
-                                "FREEZE",
-                                "CHILD",
-                                "SWIM",
-                                "SYNC",
-                                "SET",
-                                "DLY",
-                                "GPM",
-                                "RPM",
-                                "PWR",
-                                "MIN",
-                                "MAX",
-                                "MINF",
-                                "MAXF",
-                                "PRIMFLO",
-                                "PRIMTIM",
-                                "PRIOR",
-                                "SETTMP",
-                                "SETTMPNC",
-                                "SYSTIM",
-                                "NAME",
-                                "OBJLIST",
-                                "CALIB",
-                                "PROBE",
-                                "SOURCE",
-                                "ASSIGN",
-                                "PHVAL",
-                                "PHSET",
-                                "PHHI",
-                                "PHLO",
-                                "PHTNK",
-                                "ORPVAL",
-                                "ORPSET",
-                                "ORPHI",
-                                "ORPLO",
-                                "ORPTNK",
-                                "SALT",
-                                "ALK",
-                                "CALC",
-                                "CYACID",
-                                "QUALTY",
-                                "SINDEX",
-                                "SUPER",
-                                "CHLOR",
-                                "COMUART",
-                                "VER",
-                                "PROPNAME",
-                                "ADDRESS",
-                                "CITY",
-                                "STATE",
-                                "ZIP",
-                                "COUNTRY",
-                                "EMAIL",
-                                "EMAIL2",
-                                "PHONE",
-                                "PHONE2",
-                                "LOCX",
-                                "LOCY",
-                                "PASSWRD",
-                                "SERVICE",
-                                "VACFLO",
-                                "MANHT",
-                                "HEATING",
-                                "VALVE",
-                                "AVAIL",
-                                "DAY",
-                                "CLK24A",
-                                "TIMZON",
-                                "DLSTIM",
-                                "SINGLE",
-                                "START",
-                                "STOP",
-                                "SMTSRT",
-                                "UPDATE",
-                                "GROUP",
-                                "COOLING",
-                                "VACFLO",
-                                "VACTIM",
-                                "COOL",
-                                "PERMIT",
-                                "SHOMNU",
-                                "ENABLE",
-                                "CIRCUITS",
-                                "PORT",
-                                "NORMAL",
-                                "ACT",
-                            ],
-                        }
-                    ],
-                },
-            )
-
-            discovered_attrs: set[str] = set()
-            obj_count = 0
-
-            for obj in response.get("objectList", []):
-                obj_count += 1
-                params = obj.get("params", {})
-                for key, value in params.items():
-                    # Only count if the value is different from the key
-                    # (key=value means attribute doesn't exist)
-                    if value != key and value is not None:
-                        discovered_attrs.add(key)
-
-            all_discovered[objtype] = discovered_attrs
-            print(f"{obj_count} objects, {len(discovered_attrs)} unique attrs")
-
-        # Now compare with what we track
-        print("\n" + "=" * 70)
-        print("DISCOVERY RESULTS: Attributes with real values")
-        print("=" * 70)
-
-        total_new = 0
-
-        for objtype in sorted(all_discovered.keys()):
-            discovered = all_discovered[objtype]
-            tracked = ALL_ATTRIBUTES_BY_TYPE.get(objtype, set())
-
-            # Find attributes we discovered but don't track
-            new_attrs = discovered - tracked - {"OBJTYP", "HNAME", "OBJNAM"}
-
-            if new_attrs:
-                print(f"\n{objtype}: {len(new_attrs)} NEW attributes found!")
-                for attr in sorted(new_attrs):
-                    print(f"  + {attr}")
-                total_new += len(new_attrs)
-
-        if total_new == 0:
-            print("\n✓ No new attributes discovered - we're tracking everything!")
-        else:
-            print(f"\nTotal: {total_new} new attributes to consider adding")
-
-    finally:
-        await controller.stop()
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main)
@@ -1,36 +1,98 @@
 #!/usr/bin/env python3
 """Search for smart valve controls - might be under BODY, CIRCUIT, or other types."""
 
-import asyncio
-import os
-
-from dotenv import load_dotenv
-
-load_dotenv()
-
-from pyintellicenter import ICBaseController  # noqa: E402
-
-
-async def main():
-    host = os.getenv("INTELLICENTER_HOST", "10.100.11.60")
-    port = int(os.getenv("INTELLICENTER_PORT", "6681"))
-
-    print(f"Connecting to IntelliCenter at {host}:{port}...")
-
-    controller = ICBaseController(host, port)
-
-    try:
-        await controller.start()
-        print(f"Connected to: {controller.system_info.prop_name}\n")
-
-        # Check BODY objects for valve-related attributes
-        print("=" * 80)
-        print("BODY OBJECTS (pool/spa modes)")
-        print("=" * 80)
+import re
+import sys
+
+from _common import connected_controller, get_hardware_definition, real_values, run
+
+# Keys that look valve-related in the hardware definition
+_VALVE_KEY_RE = re.compile(r"valve|intake|return|spill", re.IGNORECASE)
+
+
+def _search_for_valves(root):
+    """Return "path = value" lines for valve-related keys, depth-first.
+
+    Uses an explicit stack instead of recursion. Each key is its own frame and
+    is reported when popped, with children pushed in reverse, so matches come
+    out in the same preorder as a recursive walk.
+    """
+    matches = []
+    stack = [(root, "", False)]
+    while stack:
+        obj, path, is_match = stack.pop()
+        if is_match:
+            matches.append(f"{path} = {obj!r}")
+        if isinstance(obj, dict):
+            for k, v in reversed(obj.items()):
+                is_match = _VALVE_KEY_RE.search(k) is not None
+                if is_match or isinstance(v, (dict, list)):
+                    stack.append((v, f"{path}.{k}", is_match))
+        elif isinstance(obj, list):
+            stack.extend(
+                (obj[i], f"{path}[{i}]", False)
+                for i in reversed(range(len(obj)))
+                if isinstance(obj[i], (dict, list))
+            )
+    return matches
+
+
+async def main(controller=None):
+    if controller is None:
+        async with connected_controller() as controller:
+            await main(controller)
+        return
+
+    # Check BODY objects for valve-related attributes
+    print("=" * 80)
+    print("BODY OBJECTS (pool/spa modes)")
+    print("=" * 80)
+    response = await controller.send_cmd(
+        "GetParamList",
+        {
+            "condition": "OBJTYP=BODY",
+            "objectList": [
+                {
+                    "objnam": "INCR",
+                    "keys": [
+                        "OBJTYP",
+                        "SUBTYP",
+                        "SNAME",
+                        "STATUS",
+                        "MODE",
+                        "VALVE",
+                        "INTAKE",
+                        "RETURN",
+                        "SPILLWAY",
+                        "DRAIN",
+                        "SHARE",
+                        "HEATER",
+                        "HTSRC",
+                        "HTMODE",
+                        "TEMP",
+                        "LOTMP",
+                        "HITMP",
+                    ],
+                }
+            ],
+        },
+    )
+    for obj in response.get("objectList", []):
+        params = obj.get("params", {})
+        print(f"\n{obj.get('objnam')}: {params.get('SNAME', 'N/A')}")
+        for k, v in real_values(params):
+            print(f"  {k:12} = {v!r}")
+
+    # Check for any INTELLI* subtypes in valves or other objects
+    print("\n" + "=" * 80)
+    print("SEARCHING FOR 'INTELLI' OR 'SMART' IN ALL OBJECTS")
+    print("=" * 80)
+
+    for objtype in ["VALVE", "CIRCUIT", "MODULE", "PANEL"]:
         response = await controller.send_cmd(
             "GetParamList",
             {
-                "condition": "OBJTYP=BODY",
+                "condition": f"OBJTYP={objtype}",
                 "objectList": [
                     {
                         "objnam": "INCR",
@@ -41,123 +103,64 @@ async def main():
                             "STATUS",
                             "MODE",
                             "VALVE",
-                            "INTAKE",
-                            "RETURN",
-                            "SPILLWAY",
-                            "DRAIN",
-                            "SHARE",
-                            "HEATER",
-                            "HTSRC",
-                            "HTMODE",
-                            "TEMP",
-                            "LOTMP",
-                            "HITMP",
+                            "ASSIGN",
+                            "CIRCUIT",
+                            "PARENT",
                         ],
                     }
                 ],
             },
         )
         for obj in response.get("objectList", []):
-            print(f"\n{obj.get('objnam')}: {obj.get('params', {}).get('SNAME', 'N/A')}")
-            for k, v in sorted(obj.get("params", {}).items()):
-                if v != k and v is not None:
+            params = obj.get("params", {})
+            subtyp = params.get("SUBTYP", "")
+            sname = params.get("SNAME", "")
+            # Look for anything that might be smart/intelli
+            if subtyp and subtyp != "SUBTYP":
+                print(f"\n{objtype} {obj.get('objnam')}: SUBTYP={subtyp}, SNAME={sname}")
+                for k, v in real_values(params):
                     print(f"  {k:12} = {v!r}")
 
-        # Check for any INTELLI* subtypes in valves or other objects
-        print("\n" + "=" * 80)
-        print("SEARCHING FOR 'INTELLI' OR 'SMART' IN ALL OBJECTS")
-        print("=" * 80)
-
-        for objtype in ["VALVE", "CIRCUIT", "MODULE", "PANEL"]:
-            response = await controller.send_cmd(
-                "GetParamList",
+    # Look at the hardware definition for valve configurations
+    print("\n" + "=" * 80)
+    print("HARDWARE DEFINITION (looking for valve config)")
+    print("=" * 80)
+    response = await get_hardware_definition(controller)
+
+    # Search for anything valve-related in the response
+    matches = _search_for_valves(response)
+    if matches:
+        sys.stdout.write("\n".join(matches) + "\n")
+
+    # Check CIRCGRP for spillway controls
+    print("\n" + "=" * 80)
+    print("CIRCUIT GROUPS (might include spillway)")
+    print("=" * 80)
+    response = await controller.send_cmd(
+        "GetParamList",
+        {
+            "condition": "OBJTYP=CIRCGRP",
+            "objectList": [
                 {
-                    "condition": f"OBJTYP={objtype}",
-                    "objectList": [
-                        {
-                            "objnam": "INCR",
-                            "keys": [
-                                "OBJTYP",
-                                "SUBTYP",
-                                "SNAME",
-                                "STATUS",
-                                "MODE",
-                                "VALVE",
-                                "ASSIGN",
-                                "CIRCUIT",
-                                "PARENT",
-                            ],
-                        }
+                    "objnam": "INCR",
+                    "keys": [
+                        "OBJTYP",
+                        "SUBTYP",
+                        "SNAME",
+                        "STATUS",
+                        "CIRCUIT",
+                        "USE",
                     ],
-                },
-            )
-            for obj in response.get("objectList", []):
-                params = obj.get("params", {})
-                subtyp = params.get("SUBTYP", "")
-                sname = params.get("SNAME", "")
-                # Look for anything that might be smart/intelli
-                if subtyp and subtyp != "SUBTYP":
-                    print(f"\n{objtype} {obj.get('objnam')}: SUBTYP={subtyp}, SNAME={sname}")
-                    for k, v in sorted(params.items()):
-                        if v != k and v is not None:
-                            print(f"  {k:12} = {v!r}")
-
-        # Look at the hardware definition for valve configurations
-        print("\n" + "=" * 80)
-        print("HARDWARE DEFINITION (looking for valve config)")
-        print("=" * 80)
-        response = await controller.send_cmd("GetHardwareDefinition", {})
-
-        # Search for anything valve-related in the response
-        def search_for_valves(obj, path=""):
-            if isinstance(obj, dict):
-                for k, v in obj.items():
-                    if (
-                        "valve" in k.lower()
-                        or "intake" in k.lower()
-                        or "return" in k.lower()
-                        or "spill" in k.lower()
-                    ):
-                        print(f"{path}.{k} = {v!r}")
-                    search_for_valves(v, f"{path}.{k}")
-            elif isinstance(obj, list):
-                for i, item in enumerate(obj):
-                    search_for_valves(item, f"{path}[{i}]")
-
-        search_for_valves(response)
-
-        # Check CIRCGRP for spillway controls
-        print("\n" + "=" * 80)
-        print("CIRCUIT GROUPS (might include spillway)")
-        print("=" * 80)
-        response = await controller.send_cmd(
-            "GetParamList",
-            {
-                "condition": "OBJTYP=CIRCGRP",
-                "objectList": [
-                    {
-                        "objnam": "INCR",
-                        "keys": [
-                            "OBJTYP",
-                            "SUBTYP",
-                            "SNAME",
-                            "STATUS",
-                            "CIRCUIT",
-                            "USE",
-                        ],
-                    }
-                ],
-            },
-        )
-        for obj in response.get("objectList", []):
-            print(f"\n{obj.get('objnam')}: {obj.get('params', {}).get('SNAME', 'N/A')}")
-            for k, v in sorted(obj.get("params", {}).items()):
-                if v != k and v is not None:
-                    print(f"  {k:12} = {v!r}")
-
-    finally:
-        await controller.stop()
+                }
+            ],
+        },
+    )
+    for obj in response.get("objectList", []):
+        params = obj.get("params", {})
+        print(f"\n{obj.get('objnam')}: {params.get('SNAME', 'N/A')}")
+        for k, v in real_values(params):
+            print(f"  {k:12} = {v!r}")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main)
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Run all read-only diagnostic scripts against a single IntelliCenter connection."""
+
+import audit_attributes
+import discover_all_attributes
+import find_smart_valves
+import investigate_update_flag
+import show_new_attributes
+import show_valve_status
+import test_chem_attributes
+from _common import connected_controller, run
+
+from pyintellicenter import PoolModel
+
+# Scripts that only read from the device (test_setpoint_increments writes to it)
+DIAGNOSTICS = [
+    audit_attributes,
+    discover_all_attributes,
+    find_smart_valves,
+    investigate_update_flag,
+    show_new_attributes,
+    show_valve_status,
+    test_chem_attributes,
+]
+
+
+async def main():
+    # audit_attributes needs the model, so connect with an ICModelController
+    async with connected_controller(PoolModel()) as controller:
+        for script in DIAGNOSTICS:
+            print("#" * 80)
+            print(f"# {script.__name__}")
+            print("#" * 80)
+            await script.main(controller)
+            print()
+
+
+if __name__ == "__main__":
+    run(main)
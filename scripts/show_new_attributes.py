@@ -1,14 +1,7 @@
 #!/usr/bin/env python3
 """Show the actual values of newly discovered attributes."""
 
-import asyncio
-import os
-
-from dotenv import load_dotenv
-
-load_dotenv()
-
-from pyintellicenter import ICBaseController  # noqa: E402
+from _common import connected_controller, run
 
 # New attributes discovered that we're not tracking
 NEW_ATTRS_BY_TYPE = {
@@ -30,54 +23,64 @@ NEW_ATTRS_BY_TYPE = {
     "VALVE": ["READY"],
 }
 
+# Request keys per object type (SNAME first), sorted once at import
+_REQUEST_KEYS_BY_TYPE = {
+    objtype: ["SNAME", *sorted(attrs)] for objtype, attrs in sorted(NEW_ATTRS_BY_TYPE.items())
+}
 
-async def main():
-    host = os.getenv("INTELLICENTER_HOST", "10.100.11.60")
-    port = int(os.getenv("INTELLICENTER_PORT", "6681"))
-
-    print(f"Connecting to IntelliCenter at {host}:{port}...")
-
-    controller = ICBaseController(host, port)
-
-    try:
-        await controller.start()
-        print(f"Connected to: {controller.system_info.prop_name}\n")
-
-        print("=" * 70)
-        print("NEW ATTRIBUTES - Actual Values from Device")
-        print("=" * 70)
-
-        for objtype, attrs in sorted(NEW_ATTRS_BY_TYPE.items()):
-            response = await controller.send_cmd(
-                "GetParamList",
-                {
-                    "condition": f"OBJTYP={objtype}",
-                    "objectList": [{"objnam": "INCR", "keys": ["SNAME"] + attrs}],
-                },
-            )
-
-            objects = response.get("objectList", [])
-            if objects:
-                print(f"\n{objtype} ({len(objects)} objects):")
-                print("-" * 50)
-
-                for obj in objects[:3]:  # Show up to 3 examples
-                    objnam = obj.get("objnam")
-                    params = obj.get("params", {})
-                    sname = params.get("SNAME", objnam)
-
-                    values = []
-                    for attr in attrs:
-                        val = params.get(attr)
-                        if val and val != attr:  # Has real value
-                            values.append(f"{attr}={val}")
-
-                    if values:
-                        print(f"  {sname}: {', '.join(values)}")
-
-    finally:
-        await controller.stop()
+# Keys for the single query: OBJTYP to split the results by type, plus the
+# union of the per-type request keys
+_QUERY_KEYS = [
+    "OBJTYP",
+    *dict.fromkeys(key for keys in _REQUEST_KEYS_BY_TYPE.values() for key in keys),
+]
+
+
+async def main(controller=None):
+    if controller is None:
+        async with connected_controller() as controller:
+            await main(controller)
+        return
+
+    print("=" * 70)
+    print("NEW ATTRIBUTES - Actual Values from Device")
+    print("=" * 70)
+
+    # Fetch every object in one round-trip with the union of the request keys,
+    # then group by OBJTYP and show only each type's own keys
+    response = await controller.send_cmd(
+        "GetParamList",
+        {
+            "condition": "",
+            "objectList": [{"objnam": "INCR", "keys": _QUERY_KEYS}],
+        },
+    )
+    objects_by_type: dict[str, list[dict]] = {objtype: [] for objtype in _REQUEST_KEYS_BY_TYPE}
+    for obj in response.get("objectList", []):
+        objects = objects_by_type.get(obj.get("params", {}).get("OBJTYP"))
+        if objects is not None:
+            objects.append(obj)
+
+    for objtype, keys in _REQUEST_KEYS_BY_TYPE.items():
+        objects = objects_by_type[objtype]
+        if objects:
+            print(f"\n{objtype} ({len(objects)} objects):")
+            print("-" * 50)
+
+            for obj in objects[:3]:  # Show up to 3 examples
+                objnam = obj.get("objnam")
+                params = obj.get("params", {})
+                sname = params.get("SNAME", objnam)
+
+                values = []
+                for attr in keys[1:]:
+                    val = params.get(attr)
+                    if val and val != attr:  # Has real value
+                        values.append(f"{attr}={val}")
+
+                if values:
+                    print(f"  {sname}: {', '.join(values)}")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main)
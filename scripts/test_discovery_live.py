@@ -7,14 +7,18 @@ It auto-detects the subnet from the .env configuration.
 
 import asyncio
 import ipaddress
-import os
+import site
 import sys
 from pathlib import Path
 
-# Add src to path for development
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Fall back to the source tree only when the package is not installed
+# (e.g. via `pip install -e .`), leaving the normal import path untouched
+try:
+    import pyintellicenter  # noqa: F401
+except ImportError:
+    site.addsitedir(str(Path(__file__).resolve().parent.parent / "src"))
 
-from dotenv import load_dotenv
+from _common import ENV_PATH, env, run
 
 from pyintellicenter.discovery import (
     discover_intellicenter_units,
@@ -32,31 +36,32 @@ def get_subnet_from_host(host: str) -> str:
     return str(ip)
 
 
-async def test_discovery() -> bool:
-    """Run live discovery test."""
-    # Load environment
-    env_path = Path(__file__).parent.parent / ".env"
-    if not env_path.exists():
-        print(f"❌ .env file not found at {env_path}")
+async def probe_tcp(host: str, port: int) -> bool:
+    """Return True if a TCP connection to host:port can be opened."""
+    try:
+        async with asyncio.timeout(3.0):
+            _, writer = await asyncio.open_connection(host, port)
+    except (OSError, TimeoutError):
         return False
+    writer.close()
+    await writer.wait_closed()
+    return True
 
-    load_dotenv(env_path)
-
-    host = os.getenv("INTELLICENTER_HOST")
-    port = int(os.getenv("INTELLICENTER_PORT", "6681"))
-
-    if not host:
-        print("❌ INTELLICENTER_HOST not set in .env")
-        return False
 
+async def test_discovery(host: str, port: int) -> bool:
+    """Run live discovery test."""
     subnet = get_subnet_from_host(host)
     print(f"🔍 Testing discovery on subnet: {subnet}")
     print(f"📍 Expected IntelliCenter at: {host}:{port}")
     print()
 
-    # Run discovery
+    # Run discovery, probing the TCP port in parallel while mDNS listens
     print("⏳ Running mDNS discovery (10 second timeout)...")
-    units = await discover_intellicenter_units(discovery_timeout=10.0)
+    units, tcp_reachable = await asyncio.gather(
+        discover_intellicenter_units(discovery_timeout=10.0),
+        probe_tcp(host, port),
+    )
+    print(f"  TCP port {port}: {'reachable' if tcp_reachable else 'NOT reachable'}")
 
     if not units:
         print("❌ No IntelliCenter units discovered!")
@@ -85,23 +90,22 @@ async def test_discovery() -> bool:
         if unit.host == host:
             found_expected = True
 
-    # Test find_unit_by_host
-    print("🔍 Testing find_unit_by_host()...")
-    unit_by_host = await find_unit_by_host(host, discovery_timeout=5.0)
+    # Test find_unit_by_host and find_unit_by_name (units is non-empty here);
+    # both are answered from the discovery cache filled by the sweep above
+    test_name = units[0].name
+    print(f"🔍 Testing find_unit_by_host() and find_unit_by_name('{test_name}')...")
+    unit_by_host, unit_by_name = await asyncio.gather(
+        find_unit_by_host(host, discovery_timeout=5.0),
+        find_unit_by_name(test_name, discovery_timeout=5.0),
+    )
     if unit_by_host:
         print(f"  ✅ Found unit by host: {unit_by_host.name}")
     else:
         print(f"  ❌ Could not find unit by host: {host}")
-
-    # Test find_unit_by_name if we found any units
-    if units:
-        test_name = units[0].name
-        print(f"🔍 Testing find_unit_by_name('{test_name}')...")
-        unit_by_name = await find_unit_by_name(test_name, discovery_timeout=5.0)
-        if unit_by_name:
-            print(f"  ✅ Found unit by name: {unit_by_name.host}")
-        else:
-            print(f"  ❌ Could not find unit by name: {test_name}")
+    if unit_by_name:
+        print(f"  ✅ Found unit by name: {unit_by_name.host}")
+    else:
+        print(f"  ❌ Could not find unit by name: {test_name}")
 
     print()
     if found_expected:
@@ -113,27 +117,16 @@ async def test_discovery() -> bool:
         return False
 
 
-async def test_direct_connection() -> bool:
+async def test_direct_connection(host: str, port: int) -> bool:
     """Test direct TCP connection to the IntelliCenter."""
     from pyintellicenter import ICModelController
     from pyintellicenter.exceptions import ICConnectionError
     from pyintellicenter.model import PoolModel
 
-    env_path = Path(__file__).parent.parent / ".env"
-    load_dotenv(env_path)
-
-    host = os.getenv("INTELLICENTER_HOST")
-    port = int(os.getenv("INTELLICENTER_PORT", "6681"))
-
-    if not host:
-        print("❌ INTELLICENTER_HOST not set")
-        return False
-
     print(f"🔌 Testing direct connection to {host}:{port}...")
 
+    controller = ICModelController(host, PoolModel(), port=port)
     try:
-        model = PoolModel()
-        controller = ICModelController(host, model, port=port)
         await controller.start()
 
         # Get system info
@@ -144,14 +137,15 @@ async def test_direct_connection() -> bool:
             print(f"      Version: {system_info.sw_version}")
         else:
             print("  ✅ Connected (no system info available)")
-
-        await controller.stop()
         return True
 
     except (OSError, TimeoutError, ICConnectionError) as e:
         print(f"  ❌ Connection failed: {e}")
         return False
 
+    finally:
+        await controller.stop()
+
 
 async def main() -> int:
     """Run all live tests."""
@@ -160,11 +154,18 @@ async def main() -> int:
     print("=" * 60)
     print()
 
-    discovery_ok = await test_discovery()
+    if not ENV_PATH.exists():
+        print(f"❌ .env file not found at {ENV_PATH}")
+        return 1
+
+    # Loaded once and shared by both phases
+    host, port = env()
+
+    discovery_ok = await test_discovery(host, port)
     print()
     print("-" * 60)
     print()
-    connection_ok = await test_direct_connection()
+    connection_ok = await test_direct_connection(host, port)
 
     print()
     print("=" * 60)
@@ -177,4 +178,4 @@ async def main() -> int:
 
 
 if __name__ == "__main__":
-    sys.exit(asyncio.run(main()))
+    sys.exit(run(main))
@@ -2,9 +2,8 @@
 """Test setpoint increment validation against live IntelliCenter device."""
 
 import asyncio
-import os
 
-from dotenv import load_dotenv
+from _common import env, run
 
 from pyintellicenter import ICError, ICModelController, PoolModel
 from pyintellicenter.attributes import (
@@ -15,13 +14,29 @@ from pyintellicenter.attributes import (
     SUBTYP_ATTR,
 )
 
-# Load environment variables
-load_dotenv()
+# How long to wait for IntelliCenter to report a setpoint change
+CHANGE_TIMEOUT = 2.0
+
+
+async def set_and_wait(controller, setter, objnam, attr, value):
+    """Call setter(objnam, value) and wait until the panel reports the new value.
+
+    Returns as soon as the NotifyList arrives instead of sleeping a fixed
+    interval. A rejected value produces no change and times out instead.
+    """
+    changed = controller.wait_for_attr_change(objnam, attr)
+    try:
+        await setter(objnam, value)
+        async with asyncio.timeout(CHANGE_TIMEOUT):
+            await changed
+    except TimeoutError:
+        pass
+    finally:
+        changed.cancel()
 
 
 async def main():
-    host = os.getenv("INTELLICENTER_HOST", "10.100.11.60")
-    port = int(os.getenv("INTELLICENTER_PORT", "6681"))
+    host, port = env()
 
     print(f"Connecting to IntelliCenter at {host}:{port}...")
 
@@ -36,6 +51,10 @@ async def main():
 
         # Find chemistry controllers
         chem_controllers = controller.get_chem_controllers()
+        # Read the attributes used to pick controllers once, not on every scan
+        chem_snapshot = [
+            (c, c[PHSET_ATTR], c[PRIM_ATTR], (c.sname or "").lower()) for c in chem_controllers
+        ]
         print(f"Found {len(chem_controllers)} chemistry controller(s):")
         print()
 
@@ -52,7 +71,7 @@ async def main():
         # and try some test increments
         # Detect by presence of PHSET/ORPSET or name containing "IntelliChem"
         intellichem = next(
-            (c for c in chem_controllers if c[PHSET_ATTR] is not None or "chem" in c.sname.lower()),
+            (c for c, ph, _, name in chem_snapshot if ph is not None or "chem" in name),
             None,
         )
 
@@ -83,8 +102,9 @@ async def main():
                     if 6.0 <= test_ph <= 8.5:
                         print(f"Testing pH = {test_ph} ({desc})...")
                         try:
-                            await controller.set_ph_setpoint(objnam, test_ph)
-                            await asyncio.sleep(1)
+                            await set_and_wait(
+                                controller, controller.set_ph_setpoint, objnam, PHSET_ATTR, test_ph
+                            )
                             new_ph = controller.get_ph_setpoint(objnam)
                             accepted = abs(new_ph - test_ph) < 0.001 if new_ph else False
                             print(f"  Sent: {test_ph}, Got: {new_ph} (accepted: {accepted})")
@@ -92,8 +112,9 @@ async def main():
                             print(f"  Error: {e}")
 
                         # Restore original
-                        await controller.set_ph_setpoint(objnam, original_ph)
-                        await asyncio.sleep(0.5)
+                        await set_and_wait(
+                            controller, controller.set_ph_setpoint, objnam, PHSET_ATTR, original_ph
+                        )
 
             # Test ORP increments
             print("\n--- Testing ORP increments ---")
@@ -105,8 +126,13 @@ async def main():
                     if test_orp <= 900:  # Stay within range
                         print(f"Testing ORP = {test_orp} (increment by {inc})...")
                         try:
-                            await controller.set_orp_setpoint(objnam, test_orp)
-                            await asyncio.sleep(1)
+                            await set_and_wait(
+                                controller,
+                                controller.set_orp_setpoint,
+                                objnam,
+                                ORPSET_ATTR,
+                                test_orp,
+                            )
                             new_orp = controller.get_orp_setpoint(objnam)
                             accepted = new_orp == test_orp
                             actual_change = new_orp - original_orp if new_orp else 0
@@ -118,12 +144,17 @@ async def main():
                             print(f"  Error: {e}")
 
                         # Restore original
-                        await controller.set_orp_setpoint(objnam, original_orp)
-                        await asyncio.sleep(0.5)
+                        await set_and_wait(
+                            controller,
+                            controller.set_orp_setpoint,
+                            objnam,
+                            ORPSET_ATTR,
+                            original_orp,
+                        )
 
         # Check IntelliChlor (detect by presence of PRIM or name containing "chlor")
         intellichlor = next(
-            (c for c in chem_controllers if c[PRIM_ATTR] is not None or "chlor" in c.sname.lower()),
+            (c for c, _, prim, name in chem_snapshot if prim is not None or "chlor" in name),
             None,
         )
 
@@ -145,8 +176,13 @@ async def main():
                     test_prim = min(original_prim + inc, 100)
                     print(f"Testing primary = {test_prim}% (increment by {inc})...")
                     try:
-                        await controller.set_chlorinator_output(objnam, test_prim)
-                        await asyncio.sleep(1)
+                        await set_and_wait(
+                            controller,
+                            controller.set_chlorinator_output,
+                            objnam,
+                            PRIM_ATTR,
+                            test_prim,
+                        )
                         new_output = controller.get_chlorinator_output(objnam)
                         new_prim = new_output["primary"]
                         accepted = new_prim == test_prim
@@ -159,8 +195,13 @@ async def main():
                         print(f"  Error: {e}")
 
                     # Restore original
-                    await controller.set_chlorinator_output(objnam, original_prim)
-                    await asyncio.sleep(0.5)
+                    await set_and_wait(
+                        controller,
+                        controller.set_chlorinator_output,
+                        objnam,
+                        PRIM_ATTR,
+                        original_prim,
+                    )
 
         print("\n" + "=" * 60)
         print("Test complete!")
@@ -171,4 +212,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main)
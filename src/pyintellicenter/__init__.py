@@ -22,6 +22,12 @@ Example usage:
     ```
 """
 
+from __future__ import annotations
+
+import importlib
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any
+
 # Re-export all public names from submodules
 from .attributes import (
     # Attribute name constants
@@ -137,24 +143,6 @@ from .attributes import (
     # Enums
     HeaterType,
 )
-from .connection import (
-    DEFAULT_PORT,
-    DEFAULT_TCP_PORT,
-    DEFAULT_WEBSOCKET_PORT,
-    ICConnection,
-    ICProtocol,
-    ICTransportProtocol,
-    ICWebSocketTransport,
-    TransportType,
-)
-from .controller import (
-    ICBaseController,
-    ICConnectionHandler,
-    ICConnectionHandlerCallbacks,
-    ICConnectionMetrics,
-    ICModelController,
-    ICSystemInfo,
-)
 from .exceptions import (
     ICCommandError,
     ICConnectionError,
@@ -163,7 +151,6 @@ from .exceptions import (
     ICResponseError,
     ICTimeoutError,
 )
-from .model import PoolModel, PoolObject
 from .types import (
     NotificationMessage,
     ObjectEntry,
@@ -172,20 +159,75 @@ from .types import (
     ResponseMessage,
 )
 
-# Discovery module (requires optional 'zeroconf' dependency)
-# Import conditionally to avoid ImportError when zeroconf is not installed
-try:
+if TYPE_CHECKING:
+    from .connection import (
+        DEFAULT_PORT,
+        DEFAULT_TCP_PORT,
+        DEFAULT_WEBSOCKET_PORT,
+        ICConnection,
+        ICProtocol,
+        ICTransportProtocol,
+        ICWebSocketTransport,
+        TransportType,
+    )
+    from .controller import (
+        BodyState,
+        ICBaseController,
+        ICConnectionHandler,
+        ICConnectionHandlerCallbacks,
+        ICConnectionMetrics,
+        ICModelController,
+        ICSystemInfo,
+    )
     from .discovery import (  # noqa: F401
         DEFAULT_DISCOVERY_TIMEOUT,
         ICUnit,
         discover_intellicenter_units,
         find_unit_by_host,
         find_unit_by_name,
+        invalidate_discovery_cache,
     )
+    from .model import PoolModel, PoolObject
 
-    _DISCOVERY_AVAILABLE = True
-except ImportError:
-    _DISCOVERY_AVAILABLE = False
+# Names imported from their submodule on first access (PEP 562), so that
+# importing only the attribute constants does not load the networking stack
+_LAZY_IMPORTS: dict[str, str] = {
+    "DEFAULT_PORT": ".connection",
+    "DEFAULT_TCP_PORT": ".connection",
+    "DEFAULT_WEBSOCKET_PORT": ".connection",
+    "ICConnection": ".connection",
+    "ICProtocol": ".connection",
+    "ICTransportProtocol": ".connection",
+    "ICWebSocketTransport": ".connection",
+    "TransportType": ".connection",
+    "BodyState": ".controller",
+    "ICBaseController": ".controller",
+    "ICConnectionHandler": ".controller",
+    "ICConnectionHandlerCallbacks": ".controller",
+    "ICConnectionMetrics": ".controller",
+    "ICModelController": ".controller",
+    "ICSystemInfo": ".controller",
+    "PoolModel": ".model",
+    "PoolObject": ".model",
+}
+
+# Discovery module (requires optional 'zeroconf' dependency)
+# Only offer its names when zeroconf is installed
+_DISCOVERY_AVAILABLE = find_spec("zeroconf") is not None
+if _DISCOVERY_AVAILABLE:
+    _LAZY_IMPORTS.update(
+        dict.fromkeys(
+            [
+                "DEFAULT_DISCOVERY_TIMEOUT",
+                "ICUnit",
+                "discover_intellicenter_units",
+                "find_unit_by_host",
+                "find_unit_by_name",
+                "invalidate_discovery_cache",
+            ],
+            ".discovery",
+        )
+    )
 
 __version__ = "0.1.22"
 
@@ -215,6 +257,7 @@ __all__ = [
     "ICConnectionHandlerCallbacks",
     "ICConnectionMetrics",
     "ICSystemInfo",
+    "BodyState",
     # Model classes
     "PoolModel",
     "PoolObject",
@@ -346,6 +389,24 @@ if _DISCOVERY_AVAILABLE:
             "discover_intellicenter_units",
             "find_unit_by_name",
             "find_unit_by_host",
+            "invalidate_discovery_cache",
             "DEFAULT_DISCOVERY_TIMEOUT",
         ]
     )
+
+
+def __getattr__(name: str) -> Any:
+    """Import a lazily exported name from its submodule on first access."""
+    try:
+        module = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily exported names in dir()."""
+    return sorted({*globals(), *_LAZY_IMPORTS})
@@ -30,7 +30,7 @@ if TYPE_CHECKING:
 
     from ..connection import ICConnection, TransportType
     from ..controller import ICSystemInfo
-    from ..model import PoolModel
+    from ..model import PoolModel, PoolObject
 
     class _MixinBase:
         """Static-only view of the ``ICModelController`` members used by mixins.
@@ -58,6 +58,10 @@ if TYPE_CHECKING:
             """Return cached system information (provided by ``ICBaseController``)."""
             raise NotImplementedError
 
+        def _get_by_type(self, obj_type: str, subtype: str | None = None) -> list[PoolObject]:
+            """Return the model's objects of a type (cached between model changes)."""
+            raise NotImplementedError
+
         def _get_attr_as_int(self, objnam: str, attr: str) -> int | None:
             """Return an attribute value coerced to ``int`` or ``None``."""
             raise NotImplementedError
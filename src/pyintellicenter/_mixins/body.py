@@ -7,6 +7,7 @@ state (used by Home Assistant climate/water-heater entities).
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from ..attributes import (
@@ -27,6 +28,22 @@ if TYPE_CHECKING:
     from ..model import PoolObject
 
 
+@dataclass(slots=True)
+class BodyState:
+    """Snapshot of a body's temperature and heating state.
+
+    Returned by :meth:`ICModelController.get_body_state`; an unknown body
+    reports no values and no activity.
+    """
+
+    temperature: int | None = None
+    heating_setpoint: int | None = None
+    cooling_setpoint: int | None = None
+    heat_mode: HeaterType | None = None
+    heating: bool = False
+    cooling: bool = False
+
+
 class _BodyMixin(_MixinBase):
     """Body temperature convenience methods for ``ICModelController``."""
 
@@ -145,6 +162,26 @@ class _BodyMixin(_MixinBase):
         # Check if the heater's COOL attribute is ON
         return bool(heater[COOL_ATTR] == "ON")
 
+    def get_body_state(self, body_objnam: str) -> BodyState:
+        """Get a body's temperature, setpoints, heat mode, and heating state in one call.
+
+        Args:
+            body_objnam: Object name of the body (pool or spa)
+
+        Returns:
+            BodyState with the values returned by the single-value getters
+        """
+        if not self._model[body_objnam]:
+            return BodyState()
+        return BodyState(
+            temperature=self._get_attr_as_int(body_objnam, TEMP_ATTR),
+            heating_setpoint=self._get_attr_as_int(body_objnam, LOTMP_ATTR),
+            cooling_setpoint=self._get_attr_as_int(body_objnam, HITMP_ATTR),
+            heat_mode=self.get_body_heat_mode(body_objnam),
+            heating=self.is_body_heating(body_objnam),
+            cooling=self.is_body_cooling(body_objnam),
+        )
+
     def get_body_last_temperature(self, body_objnam: str) -> int | None:
         """Get the last recorded water temperature for a body of water.
 
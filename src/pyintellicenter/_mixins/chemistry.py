@@ -52,6 +52,25 @@ CALCIUM_HARDNESS_MAX = 800  # ppm
 CYANURIC_ACID_MIN = 0  # ppm
 CYANURIC_ACID_MAX = 200  # ppm
 
+# get_chem_reading() reading types, keyed by their upper-cased name
+_CHEM_READING_ATTRS = {
+    "PH": PHVAL_ATTR,
+    "ORP": ORPVAL_ATTR,
+    "SALT": SALT_ATTR,
+    "ALK": ALK_ATTR,
+    "CYACID": CYACID_ATTR,
+    "CALC": CALC_ATTR,
+    "QUALITY": QUALTY_ATTR,
+}
+
+# get_chem_alerts() alert attributes and the names reported for them
+_CHEM_ALERTS = (
+    (PHHI_ATTR, "pH High"),
+    (PHLO_ATTR, "pH Low"),
+    (ORPHI_ATTR, "ORP High"),
+    (ORPLO_ATTR, "ORP Low"),
+)
+
 
 class _ChemistryMixin(_MixinBase):
     """Chemistry controller convenience methods for ``ICModelController``."""
@@ -333,17 +352,8 @@ class _ChemistryMixin(_MixinBase):
         if not obj:
             return None
 
-        attr_map = {
-            "pH": PHVAL_ATTR,
-            "ORP": ORPVAL_ATTR,
-            "SALT": SALT_ATTR,
-            "ALK": ALK_ATTR,
-            "CYACID": CYACID_ATTR,
-            "CALC": CALC_ATTR,
-            "QUALITY": QUALTY_ATTR,
-        }
-
-        attr = attr_map.get(reading_type.upper() if reading_type else "")
+        key = reading_type.upper() if reading_type else ""
+        attr = _CHEM_READING_ATTRS.get(key)
         if not attr:
             return None
 
@@ -353,7 +363,7 @@ class _ChemistryMixin(_MixinBase):
 
         try:
             # pH values are typically decimal, others are integers
-            if reading_type.upper() == "PH":
+            if key == "PH":
                 return float(value)
             return int(value)
         except (ValueError, TypeError):
@@ -372,19 +382,7 @@ class _ChemistryMixin(_MixinBase):
         if not obj:
             return []
 
-        alerts = []
-        alert_checks = [
-            (PHHI_ATTR, "pH High"),
-            (PHLO_ATTR, "pH Low"),
-            (ORPHI_ATTR, "ORP High"),
-            (ORPLO_ATTR, "ORP Low"),
-        ]
-
-        for attr, name in alert_checks:
-            if obj[attr] == STATUS_ON:
-                alerts.append(name)
-
-        return alerts
+        return [name for attr, name in _CHEM_ALERTS if obj[attr] == STATUS_ON]
 
     def has_chem_alert(self, chem_objnam: str) -> bool:
         """Check if any chemistry alert is active.
@@ -395,7 +393,10 @@ class _ChemistryMixin(_MixinBase):
         Returns:
             True if any alert is active
         """
-        return len(self.get_chem_alerts(chem_objnam)) > 0
+        obj = self._model[chem_objnam]
+        if not obj:
+            return False
+        return any(obj[attr] == STATUS_ON for attr, _ in _CHEM_ALERTS)
 
     def get_saturation_index(self, chem_objnam: str) -> float | None:
         """Get the Saturation Index (water balance score) for a chem controller.
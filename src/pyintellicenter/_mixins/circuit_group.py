@@ -70,11 +70,7 @@ class _CircuitGroupMixin(_MixinBase):
             Membership rows sorted by valid LISTORD, then object name
         """
         return sorted(
-            (
-                obj
-                for obj in self._model.get_by_type(CIRCGRP_TYPE)
-                if obj[PARENT_ATTR] == parent_objnam
-            ),
+            (obj for obj in self._get_by_type(CIRCGRP_TYPE) if obj[PARENT_ATTR] == parent_objnam),
             key=_member_order,
         )
 
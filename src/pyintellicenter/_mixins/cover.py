@@ -29,7 +29,7 @@ class _CoverMixin(_MixinBase):
         Returns:
             List of PoolObject for covers
         """
-        return [obj for obj in self._model.get_by_type(EXTINSTR_TYPE) if obj.subtype == "COVER"]
+        return [obj for obj in self._get_by_type(EXTINSTR_TYPE) if obj.subtype == "COVER"]
 
     async def set_cover_state(self, objnam: str, state: bool) -> dict[str, Any]:
         """Open or close a cover.
@@ -126,7 +126,7 @@ class _HeaterMixin(_MixinBase):
             return False
 
         # Check ALL heaters to see if any support this body AND can cool
-        all_heaters = list(self._model.get_by_type(HEATER_TYPE))
+        all_heaters = list(self._get_by_type(HEATER_TYPE))
 
         for heater in all_heaters:
             # Check if this heater supports this body
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from ..attributes import ACT_ATTR, LIGHT_EFFECTS, USE_ATTR
+from ..attributes import ACT_ATTR, CIRCUIT_TYPE, LIGHT_EFFECTS, USE_ATTR
 from ._base import _MixinBase
 
 if TYPE_CHECKING:
@@ -27,10 +27,16 @@ class _LightMixin(_MixinBase):
         Returns:
             List of PoolObject for light circuits
         """
-        lights = [obj for obj in self._model if obj.is_a_light]
-        if include_shows:
-            lights.extend(obj for obj in self._model if obj.is_a_light_show)
-        return lights
+        # Lights and light shows are both circuits; split them in one pass,
+        # keeping the lights ahead of the shows
+        lights: list[PoolObject] = []
+        shows: list[PoolObject] = []
+        for obj in self._get_by_type(CIRCUIT_TYPE):
+            if obj.is_a_light:
+                lights.append(obj)
+            elif include_shows and obj.is_a_light_show:
+                shows.append(obj)
+        return lights + shows
 
     def get_color_lights(self) -> list[PoolObject]:
         """Get lights that support color effects (IntelliBrite, MagicStream, etc.).
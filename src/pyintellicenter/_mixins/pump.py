@@ -114,7 +114,7 @@ class _PumpMixin(_MixinBase):
         Returns:
             List of PoolObject for pump circuits
         """
-        return self._model.get_by_type(PMPCIRC_TYPE)
+        return self._get_by_type(PMPCIRC_TYPE)
 
     def get_pump_circuit_speed(self, pmpcirc_objnam: str) -> int | None:
         """Get the speed for a pump circuit if valid for current mode.
@@ -25,7 +25,7 @@ class _ScheduleMixin(_MixinBase):
 
     def get_schedules(self) -> list[PoolObject]:
         """Get all schedule objects."""
-        return self._model.get_by_type(SCHED_TYPE)
+        return self._get_by_type(SCHED_TYPE)
 
     def is_schedule_enabled(self, sched_objnam: str) -> bool:
         """Check if a schedule is enabled (will run at its scheduled time).
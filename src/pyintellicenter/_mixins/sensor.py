@@ -27,7 +27,7 @@ class _SensorMixin(_MixinBase):
         Returns:
             List of PoolObject matching the subtype
         """
-        return self._model.get_by_type(SENSE_TYPE, subtype)
+        return self._get_by_type(SENSE_TYPE, subtype)
 
     def get_solar_sensors(self) -> list[PoolObject]:
         """Get all solar temperature sensors.
@@ -76,31 +76,31 @@ class _SystemMixin(_MixinBase):
 
     def get_bodies(self) -> list[PoolObject]:
         """Get all body objects (pools and spas)."""
-        return self._model.get_by_type(BODY_TYPE)
+        return self._get_by_type(BODY_TYPE)
 
     def get_circuits(self) -> list[PoolObject]:
         """Get all circuit objects."""
-        return self._model.get_by_type(CIRCUIT_TYPE)
+        return self._get_by_type(CIRCUIT_TYPE)
 
     def get_heaters(self) -> list[PoolObject]:
         """Get all heater objects."""
-        return self._model.get_by_type(HEATER_TYPE)
+        return self._get_by_type(HEATER_TYPE)
 
     def get_sensors(self) -> list[PoolObject]:
         """Get all sensor objects."""
-        return self._model.get_by_type(SENSE_TYPE)
+        return self._get_by_type(SENSE_TYPE)
 
     def get_pumps(self) -> list[PoolObject]:
         """Get all pump objects."""
-        return self._model.get_by_type(PUMP_TYPE)
+        return self._get_by_type(PUMP_TYPE)
 
     def get_chem_controllers(self) -> list[PoolObject]:
         """Get all chemistry controller objects (IntelliChem, IntelliChlor)."""
-        return self._model.get_by_type(CHEM_TYPE)
+        return self._get_by_type(CHEM_TYPE)
 
     def get_valves(self) -> list[PoolObject]:
         """Get all valve objects."""
-        return self._model.get_by_type(VALVE_TYPE)
+        return self._get_by_type(VALVE_TYPE)
 
     # =========================================================================
     # Valve Helpers
@@ -154,7 +154,7 @@ from .system import (
 )
 
 # Master mapping of object types to their tracked attributes
-ALL_ATTRIBUTES_BY_TYPE = {
+ALL_ATTRIBUTES_BY_TYPE: dict[str, frozenset[str]] = {
     BODY_TYPE: BODY_ATTRIBUTES,
     CHEM_TYPE: CHEM_ATTRIBUTES,
     CIRCGRP_TYPE: CIRCGRP_ATTRIBUTES,
@@ -177,6 +177,19 @@ ALL_ATTRIBUTES_BY_TYPE = {
     VALVE_TYPE: VALVE_ATTRIBUTES,
 }
 
+
+def _build_attr_to_types() -> dict[str, tuple[str, ...]]:
+    """Invert ALL_ATTRIBUTES_BY_TYPE into attribute -> sorted object types."""
+    types_by_attr: dict[str, list[str]] = {}
+    for objtype in sorted(ALL_ATTRIBUTES_BY_TYPE):
+        for attr in ALL_ATTRIBUTES_BY_TYPE[objtype]:
+            types_by_attr.setdefault(attr, []).append(objtype)
+    return {attr: tuple(objtypes) for attr, objtypes in types_by_attr.items()}
+
+
+# Reverse index: which object types track a given attribute
+ATTR_TO_TYPES: dict[str, tuple[str, ...]] = _build_attr_to_types()
+
 __all__ = [
     # Enums
     "HeaterType",
@@ -295,6 +308,7 @@ __all__ = [
     "VOL_ATTR",
     # Attribute sets
     "ALL_ATTRIBUTES_BY_TYPE",
+    "ATTR_TO_TYPES",
     "BODY_ATTRIBUTES",
     "CHEM_ATTRIBUTES",
     "CIRCGRP_ATTRIBUTES",
@@ -28,39 +28,41 @@ from .constants import (
 
 # Represents a body of water (pool or spa)
 # Matches node-intellicenter GetBodyStatus attributes
-BODY_ATTRIBUTES = {
-    "ACT1",  # (int) Activity setting 1
-    "ACT2",  # (int) Activity setting 2
-    "ACT3",  # (int) Activity setting 3
-    "ACT4",  # (int) Activity setting 4
-    BOOST_ATTR,  # (ON/OFF) Boost heating enabled
-    CIRCUIT_ATTR,  # (objnam) Associated circuit
-    "FILTER",  # (objnam) Circuit object that filters this body
-    HEATER_ATTR,  # (objnam) Associated heater
-    HITMP_ATTR,  # (int) Cooling setpoint (cool down to this temperature)
-    HNAME_ATTR,  # equals to OBJNAM
-    HTMODE_ATTR,  # (int) >0 if currently heating, 0 if not
-    "HTSRC",  # (objnam) the heating source (or '00000')
-    LISTORD_ATTR,  # (int) used to order in UI
-    LOTMP_ATTR,  # (int) Heat setpoint (heat up to this temperature)
-    LSTTMP_ATTR,  # (int) Last recorded temperature
-    "MANHT",  # Manual heating
-    "MANUAL",  # (int) Manual mode
-    MODE_ATTR,  # (str) Current mode
-    PARENT_ATTR,  # (objnam) parent object
-    PRIM_ATTR,  # (int) Primary setting
-    READY_ATTR,  # (ON/OFF) Ready state
-    SEC_ATTR,  # (int) Secondary setting
-    SELECT_ATTR,  # (str) Selection mode
-    "SETPT",  # (int) Set point (same as LOTMP)
-    SETTMP_ATTR,  # (int) Temperature setpoint (similar to LOTMP, used by some systems)
-    "SHARE",  # (objnam) Sharing with other body
-    SNAME_ATTR,  # (str) Friendly name
-    SPEED_ATTR,  # (int) Speed setting
-    "SRCTYP",  # Source type (e.g., "GENERIC")
-    STATIC_ATTR,  # (ON/OFF) Static setting
-    STATUS_ATTR,  # (ON/OFF) 'ON' if body is "active"
-    SUBTYP_ATTR,  # 'POOL' or 'SPA'
-    TEMP_ATTR,  # (int) Current temperature
-    VOL_ATTR,  # (int) Volume in Gallons
-}
+BODY_ATTRIBUTES: frozenset[str] = frozenset(
+    {
+        "ACT1",  # (int) Activity setting 1
+        "ACT2",  # (int) Activity setting 2
+        "ACT3",  # (int) Activity setting 3
+        "ACT4",  # (int) Activity setting 4
+        BOOST_ATTR,  # (ON/OFF) Boost heating enabled
+        CIRCUIT_ATTR,  # (objnam) Associated circuit
+        "FILTER",  # (objnam) Circuit object that filters this body
+        HEATER_ATTR,  # (objnam) Associated heater
+        HITMP_ATTR,  # (int) Cooling setpoint (cool down to this temperature)
+        HNAME_ATTR,  # equals to OBJNAM
+        HTMODE_ATTR,  # (int) >0 if currently heating, 0 if not
+        "HTSRC",  # (objnam) the heating source (or '00000')
+        LISTORD_ATTR,  # (int) used to order in UI
+        LOTMP_ATTR,  # (int) Heat setpoint (heat up to this temperature)
+        LSTTMP_ATTR,  # (int) Last recorded temperature
+        "MANHT",  # Manual heating
+        "MANUAL",  # (int) Manual mode
+        MODE_ATTR,  # (str) Current mode
+        PARENT_ATTR,  # (objnam) parent object
+        PRIM_ATTR,  # (int) Primary setting
+        READY_ATTR,  # (ON/OFF) Ready state
+        SEC_ATTR,  # (int) Secondary setting
+        SELECT_ATTR,  # (str) Selection mode
+        "SETPT",  # (int) Set point (same as LOTMP)
+        SETTMP_ATTR,  # (int) Temperature setpoint (similar to LOTMP, used by some systems)
+        "SHARE",  # (objnam) Sharing with other body
+        SNAME_ATTR,  # (str) Friendly name
+        SPEED_ATTR,  # (int) Speed setting
+        "SRCTYP",  # Source type (e.g., "GENERIC")
+        STATIC_ATTR,  # (ON/OFF) Static setting
+        STATUS_ATTR,  # (ON/OFF) 'ON' if body is "active"
+        SUBTYP_ATTR,  # 'POOL' or 'SPA'
+        TEMP_ATTR,  # (int) Current temperature
+        VOL_ATTR,  # (int) Volume in Gallons
+    }
+)
@@ -24,6 +24,8 @@ import asyncio
 import contextlib
 import inspect
 import logging
+import socket
+import time
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Literal, Protocol, runtime_checkable
 
@@ -54,10 +56,47 @@ KEEPALIVE_MAX_FAILURES = 3  # consecutive missed keepalives before the link is d
 CONNECTION_TIMEOUT = 10.0  # seconds to wait for initial connection
 MAX_BUFFER_SIZE = 1024 * 1024  # 1MB max buffer to prevent DoS
 DEFAULT_NOTIFICATION_QUEUE_SIZE = 100  # max queued notifications
+TCP_KEEPIDLE = 30  # seconds idle before the OS sends TCP keepalive probes
+TCP_KEEPINTVL = 10  # seconds between unanswered TCP keepalive probes
+TCP_KEEPCNT = 3  # unanswered TCP keepalive probes before the OS drops the link
 
 # Backwards compatibility alias
 DEFAULT_PORT = DEFAULT_TCP_PORT
 
+# Body of the periodic keepalive request, built once rather than per tick
+_KEEPALIVE_PARAMS: dict[str, Any] = {
+    "condition": "OBJTYP=SYSTEM",
+    "objectList": [{"objnam": "INCR", "keys": ["MODE"]}],
+}
+
+
+def _configure_tcp_socket(sock: socket.socket | None) -> None:
+    """Disable Nagle and enable OS-level keepalive on a connected TCP socket.
+
+    Commands are small JSON frames, so Nagle only delays them. Keepalive
+    probes stop NAT devices from silently dropping an idle connection between
+    the application-level keepalive requests. Options the platform does not
+    support are skipped.
+    """
+    if sock is None:
+        return
+    options = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    for name, value in (
+        ("TCP_KEEPIDLE", TCP_KEEPIDLE),
+        ("TCP_KEEPINTVL", TCP_KEEPINTVL),
+        ("TCP_KEEPCNT", TCP_KEEPCNT),
+    ):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    for level, option, value in options:
+        try:
+            sock.setsockopt(level, option, value)
+        except OSError as err:
+            _LOGGER.debug("Could not set socket option %s: %s", option, err)
+
 
 @dataclass(slots=True)
 class _NotificationObserverState:
@@ -168,10 +207,7 @@ class ICNotificationMixin:
         notification_observer_state: _NotificationObserverState | None,
     ) -> None:
         """Initialize notification handling state."""
-        self._notification_callback = notification_callback
-        self._is_async_callback = (
-            inspect.iscoroutinefunction(notification_callback) if notification_callback else False
-        )
+        self._set_notification_callback(notification_callback)
         self._notification_queue_size = notification_queue_size
         self._notification_queue = None
         self._consumer_task = None
@@ -181,6 +217,15 @@ class ICNotificationMixin:
             else _NotificationObserverState()
         )
 
+    def _set_notification_callback(self, callback: NotificationCallback | None) -> None:
+        """Set the notification callback, resolving whether it is async once.
+
+        The consumer branches on the cached flag, so the per-notification
+        path never needs to inspect the callback.
+        """
+        self._notification_callback = callback
+        self._is_async_callback = inspect.iscoroutinefunction(callback) if callback else False
+
     def _start_notification_consumer(self) -> None:
         """Start the notification consumer task if not already running."""
         if self._notification_queue is not None:
@@ -203,16 +248,34 @@ class ICNotificationMixin:
         """Dispatch a parsed message to the appropriate handler."""
         if "response" in msg:
             self._handle_response(msg)
-        elif msg.get("command") == "NotifyList":
+            return
+
+        command = msg.get("command")
+        if command == "NotifyList":
             _LOGGER.debug("Received NotifyList notification")
             self._handle_notification(msg)
         else:
-            _LOGGER.debug("Received unknown message type: %s", msg.get("command"))
+            _LOGGER.debug("Received unknown message type: %s", command)
 
     def _handle_response(self, msg: dict[str, Any]) -> None:
         """Handle a response message - implemented by subclasses."""
         raise NotImplementedError
 
+    def _drop_unobserved_notification(self, frame: bytes | bytearray) -> bool:
+        """Return True if frame is a NotifyList nobody is listening to.
+
+        Such frames are counted, so observer sequence numbers stay
+        contiguous, but never parsed: a full-state NotifyList can be large.
+        Anything that may be a response is always parsed.
+        """
+        state = self._notification_observer_state
+        if self._notification_callback is not None or state.observers:
+            return False
+        if b'"NotifyList"' not in frame[:256] or b'"response"' in frame:
+            return False
+        state.sequence += 1
+        return True
+
     def _handle_notification(self, msg: dict[str, Any]) -> None:
         """Handle a NotifyList notification by queuing for processing."""
         state = self._notification_observer_state
@@ -306,6 +369,10 @@ class ICProtocol(ICRequestMixin, ICNotificationMixin, asyncio.Protocol):
         # Buffer for incomplete messages (bytearray for efficient appending)
         self._buffer = bytearray()
 
+        # Offset in _buffer already searched for a terminator, so a message
+        # arriving in many chunks is not rescanned from the start each time
+        self._scan_pos = 0
+
         # Connection state
         self._connected = False
 
@@ -319,6 +386,7 @@ class ICProtocol(ICRequestMixin, ICNotificationMixin, asyncio.Protocol):
         self._transport = transport  # type: ignore[assignment]
         self._connected = True
         self._buffer = bytearray()
+        self._scan_pos = 0
         self._message_id = 0
         peername = transport.get_extra_info("peername")
         _LOGGER.debug("TCP connected to IntelliCenter at %s", peername)
@@ -343,27 +411,42 @@ class ICProtocol(ICRequestMixin, ICNotificationMixin, asyncio.Protocol):
             self._disconnect_callback(exc)
 
     def data_received(self, data: bytes) -> None:
-        """Called by event loop when data arrives."""
-        self._buffer.extend(data)
+        """Called by event loop when data arrives.
 
-        if len(self._buffer) > MAX_BUFFER_SIZE:
+        Each message is framed by \\r\\n. The buffer is searched from where
+        the previous call stopped, and consumed messages are removed with a
+        single deletion once the whole chunk has been processed.
+        """
+        buffer = self._buffer
+        buffer.extend(data)
+
+        if len(buffer) > MAX_BUFFER_SIZE:
             _LOGGER.error("Buffer overflow - closing connection")
             if self._transport:
                 self._transport.close()
             return
 
-        while b"\r\n" in self._buffer:
-            idx = self._buffer.index(b"\r\n")
-            line = bytes(self._buffer[:idx])
-            del self._buffer[: idx + 2]
+        start = 0
+        # Back up one byte in case the terminator was split across chunks
+        end = buffer.find(b"\r\n", max(self._scan_pos - 1, 0))
+        while end != -1:
+            line = buffer[start:end]
+            start = end + 2
+            end = buffer.find(b"\r\n", start)
+
+            if self._drop_unobserved_notification(line):
+                continue
 
             try:
                 msg: dict[str, Any] = orjson.loads(line)
             except orjson.JSONDecodeError as err:
                 _LOGGER.error("Invalid JSON received: %s", err)
-                continue
+            else:
+                self._dispatch_message(msg)
 
-            self._dispatch_message(msg)
+        if start:
+            del buffer[:start]
+        self._scan_pos = len(buffer)
 
     async def send_request(
         self,
@@ -385,18 +468,20 @@ class ICProtocol(ICRequestMixin, ICNotificationMixin, asyncio.Protocol):
             **kwargs,
         }
 
-        # Create Future for this request (uses running event loop automatically)
-        self._response_future = asyncio.Future()
+        # Create Future for this request via the running loop's factory
+        self._response_future = asyncio.get_running_loop().create_future()
         self._pending_message_id = msg_id
 
         try:
-            packet = orjson.dumps(request) + b"\r\n"
+            payload = orjson.dumps(request)
             if _before_write_callback is not None:
                 _before_write_callback(
                     self._notification_observer_state.sequence,
                     asyncio.get_running_loop().time(),
                 )
-            self._transport.write(packet)
+            # Hand payload and terminator over together instead of copying
+            # the payload into a new bytes object just to append two bytes
+            self._transport.writelines((payload, b"\r\n"))
             if _after_write_callback is not None:
                 _after_write_callback(self._notification_observer_state.sequence)
             _LOGGER.debug("Sent TCP request: %s (ID: %s)", command, msg_id)
@@ -524,6 +609,9 @@ class ICWebSocketTransport(ICRequestMixin, ICNotificationMixin):
             async for message in self._ws:
                 data = message if isinstance(message, bytes) else message.encode()
 
+                if self._drop_unobserved_notification(data):
+                    continue
+
                 try:
                     msg: dict[str, Any] = orjson.loads(data)
                 except orjson.JSONDecodeError as err:
@@ -584,8 +672,8 @@ class ICWebSocketTransport(ICRequestMixin, ICNotificationMixin):
             **kwargs,
         }
 
-        # Create Future for this request (uses running event loop automatically)
-        self._response_future = asyncio.Future()
+        # Create Future for this request via the running loop's factory
+        self._response_future = asyncio.get_running_loop().create_future()
         self._pending_message_id = msg_id
 
         try:
@@ -732,6 +820,10 @@ class ICConnection:
         # Keepalive task
         self._keepalive_task: asyncio.Task[None] | None = None
 
+        # Monotonic time of the last answered request; recent traffic makes
+        # a keepalive redundant
+        self._last_activity = 0.0
+
         # Ensures the disconnect callback fires at most once per connection
         # (the keepalive teardown and the transport's own notification can race)
         self._disconnect_dispatched = False
@@ -771,10 +863,7 @@ class ICConnection:
         """
         self._notification_callback = callback
         if self._protocol:
-            self._protocol._notification_callback = callback
-            self._protocol._is_async_callback = (
-                inspect.iscoroutinefunction(callback) if callback else False
-            )
+            self._protocol._set_notification_callback(callback)
             if callback and self._protocol.connected and self._protocol._notification_queue is None:
                 self._protocol._start_notification_consumer()
 
@@ -914,7 +1003,7 @@ class ICConnection:
             loop = asyncio.get_running_loop()
 
             async with asyncio.timeout(CONNECTION_TIMEOUT):
-                _, protocol = await loop.create_connection(
+                transport, protocol = await loop.create_connection(
                     lambda: ICProtocol(
                         notification_callback=self._notification_callback,
                         disconnect_callback=disconnect_callback,
@@ -925,6 +1014,7 @@ class ICConnection:
                     self._port,
                 )
 
+            _configure_tcp_socket(transport.get_extra_info("socket"))
             self._protocol = protocol
             _LOGGER.debug("Connected to IC via TCP at %s:%s", self._host, self._port)
 
@@ -1024,13 +1114,15 @@ class ICConnection:
         )
 
         async with self._request_lock:
-            return await self._protocol.send_request(
+            response = await self._protocol.send_request(
                 command,
                 request_timeout=effective_timeout,
                 _before_write_callback=_before_write_callback,
                 _after_write_callback=_after_write_callback,
                 **kwargs,
             )
+        self._last_activity = time.monotonic()
+        return response
 
     async def _keepalive_loop(self) -> None:
         """Send periodic keepalive requests to maintain connection health.
@@ -1050,22 +1142,37 @@ class ICConnection:
         ``KEEPALIVE_MAX_FAILURES`` consecutive timeouts - the documented
         design. A connection error, by contrast, is definitive and tears the
         connection down immediately.
+
+        A keepalive is only sent once the link has been idle for a full
+        interval: an answered request or a received notification already
+        proves it alive, so the next check is pushed back instead.
         """
         failures = 0
+        seen_sequence = self._notification_observer_state.sequence
+        delay = self._keepalive_interval
         try:
             while self.connected:
-                await asyncio.sleep(self._keepalive_interval)
+                await asyncio.sleep(delay)
 
                 if not self.connected:
                     return
 
+                delay = self._keepalive_interval
+                sequence = self._notification_observer_state.sequence
+                idle = time.monotonic() - self._last_activity
+                if sequence != seen_sequence or idle < self._keepalive_interval:
+                    seen_sequence = sequence
+                    failures = 0
+                    if idle < self._keepalive_interval:
+                        delay -= idle
+                    continue
+
                 try:
                     _LOGGER.debug("Sending keepalive request")
                     await self.send_request(
                         "GetParamList",
                         request_timeout=KEEPALIVE_TIMEOUT,
-                        condition="OBJTYP=SYSTEM",
-                        objectList=[{"objnam": "INCR", "keys": ["MODE"]}],
+                        **_KEEPALIVE_PARAMS,
                     )
                     failures = 0
                 except (ICTimeoutError, TimeoutError) as err:
@@ -14,8 +14,10 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
+import random
 import time
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
+from hashlib import blake2b
 from typing import TYPE_CHECKING, Any, ClassVar, Protocol, runtime_checkable
 
 from ._mixins import (
@@ -35,6 +37,9 @@ from ._mixins import (
 # ._mixins.chemistry but were historically importable from this module
 # (pyintellicenter.controller.<CONST>). Re-export them with redundant aliases so
 # the original import path keeps working and consumers are not broken.
+from ._mixins.body import (
+    BodyState as BodyState,
+)
 from ._mixins.chemistry import (
     ALKALINITY_MAX as ALKALINITY_MAX,
 )
@@ -254,12 +259,13 @@ from .attributes import (
 )
 from .connection import DEFAULT_TCP_PORT, DEFAULT_WEBSOCKET_PORT, ICConnection, TransportType
 from .exceptions import ICCommandError, ICConnectionError, ICError, ICResponseError, ICTimeoutError
+from .model import PoolObject
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Callable
     from contextlib import AbstractAsyncContextManager
 
-    from .model import PoolModel, PoolObject
+    from .model import PoolModel
     from .types import ObjectEntry
 
 _LOGGER = logging.getLogger(__name__)
@@ -268,7 +274,7 @@ _LOGGER = logging.getLogger(__name__)
 MAX_ATTRIBUTES_PER_QUERY = 50  # Maximum attributes per query batch
 
 
-@dataclass
+@dataclass(slots=True)
 class ICConnectionMetrics:
     """Tracks connection metrics for observability."""
 
@@ -279,8 +285,18 @@ class ICConnectionMetrics:
     successful_connects: int = 0
 
     def to_dict(self) -> dict[str, int]:
-        """Return metrics as a dictionary."""
-        return asdict(self)
+        """Return metrics as a dictionary.
+
+        Built directly rather than with ``dataclasses.asdict``, which deep-copies
+        every field; keep the keys in step with the fields above.
+        """
+        return {
+            "requests_sent": self.requests_sent,
+            "requests_completed": self.requests_completed,
+            "requests_failed": self.requests_failed,
+            "reconnect_attempts": self.reconnect_attempts,
+            "successful_connects": self.successful_connects,
+        }
 
     def __repr__(self) -> str:
         return (
@@ -316,19 +332,16 @@ class ICSystemInfo:
         SNAME_ATTR,
     ]
 
-    def __init__(self, objnam: str, params: dict[str, Any]) -> None:
-        # Lazy import to avoid loading hashlib at module level
-        from hashlib import blake2b
+    __slots__ = ("_mode", "_objnam", "_prop_name", "_sw_version", "_unique_id")
 
+    def __init__(self, objnam: str, params: dict[str, Any]) -> None:
         self._objnam = objnam
         self._prop_name: str = params[PROPNAME_ATTR]
         self._sw_version: str = params[VER_ATTR]
         self._mode: str = params[MODE_ATTR]
 
         # Generate unique ID from system name
-        h = blake2b(digest_size=8)
-        h.update(params[SNAME_ATTR].encode())
-        self._unique_id = h.hexdigest()
+        self._unique_id = blake2b(params[SNAME_ATTR].encode(), digest_size=8).hexdigest()
 
     def __repr__(self) -> str:
         return (
@@ -380,7 +393,30 @@ def prune(obj: Any) -> Any:
     return obj
 
 
-@dataclass
+def _pack_queries(queries: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+    """Pack per-object attribute queries into batches of at most MAX_ATTRIBUTES_PER_QUERY keys.
+
+    First-fit: each query goes into the first batch that still has room, so a
+    small query can fill a gap an earlier batch left behind. This never needs
+    more batches than flushing a batch as soon as the next query would not
+    fit. A single query with more keys than the limit gets a batch of its own.
+    """
+    batches: list[list[dict[str, Any]]] = []
+    room: list[int] = []
+    for query in queries:
+        size = len(query["keys"])
+        for index, free in enumerate(room):
+            if size <= free:
+                batches[index].append(query)
+                room[index] -= size
+                break
+        else:
+            batches.append([query])
+            room.append(MAX_ATTRIBUTES_PER_QUERY - size)
+    return batches
+
+
+@dataclass(slots=True)
 class _RequestContext:
     """Context for tracking a single request's metrics."""
 
@@ -805,6 +841,14 @@ class ICModelController(
         # Held in a set so they are not garbage-collected before completing.
         self._monitor_tasks: set[asyncio.Task[None]] = set()
 
+        # get_by_type() results per (type, subtype), valid while the model's
+        # object count and PoolObject._type_changes match the stored generation
+        self._by_type_cache: dict[tuple[str, str | None], list[PoolObject]] = {}
+        self._by_type_generation: tuple[int, int] = (-1, -1)
+
+        # Futures waiting for the next change of an (objnam, attr) pair
+        self._attr_waiters: dict[tuple[str, str], list[asyncio.Future[Any]]] = {}
+
     def __repr__(self) -> str:
         return (
             f"ICModelController(host={self._host!r}, port={self._port}, "
@@ -823,6 +867,65 @@ class ICModelController(
         """Set callback for model updates."""
         self._updated_callback = callback
 
+    def wait_for_attr_change(self, objnam: str, attr: str) -> asyncio.Future[Any]:
+        """Return a future resolved with the next changed value of an attribute.
+
+        The waiter is registered immediately, so create it *before* sending the
+        request that triggers the change to avoid missing a fast notification.
+        Bound the wait with ``asyncio.timeout``; cancelling the future (or a
+        timeout) unregisters it. Waiters still pending when the controller is
+        stopped or the connection drops fail with :class:`ICConnectionError`.
+
+        Args:
+            objnam: Object name to watch
+            attr: Attribute name to watch
+
+        Returns:
+            Future resolved with the attribute's new value
+        """
+        key = (objnam, attr)
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._attr_waiters.setdefault(key, []).append(future)
+        future.add_done_callback(lambda fut: self._discard_attr_waiter(key, fut))
+        return future
+
+    def _discard_attr_waiter(self, key: tuple[str, str], future: asyncio.Future[Any]) -> None:
+        """Unregister a finished attribute waiter."""
+        waiters = self._attr_waiters.get(key)
+        if waiters is None:
+            return
+        with contextlib.suppress(ValueError):
+            waiters.remove(future)
+        if not waiters:
+            del self._attr_waiters[key]
+
+    def _fail_attr_waiters(self, exc: Exception) -> None:
+        """Fail every pending attribute waiter with the given exception."""
+        waiters = self._attr_waiters
+        self._attr_waiters = {}
+        for futures in waiters.values():
+            for future in futures:
+                if not future.done():
+                    future.set_exception(exc)
+
+    async def stop(self) -> None:
+        """Stop the controller, failing any pending attribute waiters."""
+        await super().stop()
+        self._fail_attr_waiters(ICConnectionError("Controller stopped"))
+
+    def _on_disconnect(self, exc: Exception | None) -> None:
+        """Fail pending attribute waiters, then report the disconnection."""
+        self._fail_attr_waiters(ICConnectionError("Connection lost"))
+        super()._on_disconnect(exc)
+
+    def _resolve_attr_waiters(self, updates: dict[str, dict[str, Any]]) -> None:
+        """Resolve waiters whose (objnam, attr) changed in this update."""
+        for key in [k for k in self._attr_waiters if k[1] in updates.get(k[0], {})]:
+            value = updates[key[0]][key[1]]
+            for future in self._attr_waiters.pop(key):
+                if not future.done():
+                    future.set_result(value)
+
     async def start(self) -> None:
         """Connect, fetch objects, and start monitoring.
 
@@ -884,10 +987,19 @@ class ICModelController(
         added_objnams: set[str] = set()
         updates = self._model.process_updates(changes_as_list, added_objnams)
 
+        # New objects or type changes invalidate the cached type lookups
+        if added_objnams or any(
+            OBJTYP_ATTR in changed or SUBTYP_ATTR in changed for changed in updates.values()
+        ):
+            self._by_type_cache.clear()
+
         # Update ICSystemInfo if changed
         if self._system_info and self._system_info.objnam in updates:
             self._system_info.update(updates[self._system_info.objnam])
 
+        if updates and self._attr_waiters:
+            self._resolve_attr_waiters(updates)
+
         # Notify callback (newly-added objects are included in updates, so the
         # existing callback path surfaces them to consumers).
         if updates and self._updated_callback:
@@ -941,21 +1053,8 @@ class ICModelController(
         if not queries:
             return
 
-        batch: list[dict[str, Any]] = []
-        num_attributes = 0
         try:
-            for items in queries:
-                keys_len = len(items["keys"])
-                # Flush the current batch before it would exceed the limit (a
-                # single object with more keys than the limit is still sent alone).
-                if batch and num_attributes + keys_len > MAX_ATTRIBUTES_PER_QUERY:
-                    await self._send_monitor_batch(batch)
-                    batch = []
-                    num_attributes = 0
-                batch.append(items)
-                num_attributes += keys_len
-
-            if batch:
+            for batch in _pack_queries(queries):
                 await self._send_monitor_batch(batch)
         except (ICConnectionError, ICCommandError, ICTimeoutError, OSError) as err:
             _LOGGER.warning("Failed to request monitoring for new objects %s: %s", objnams, err)
@@ -1186,6 +1285,24 @@ class ICModelController(
             self._remove_pending_request(request)
             raise
 
+    def _get_by_type(self, obj_type: str, subtype: str | None = None) -> list[PoolObject]:
+        """Return the model's objects of a type, cached between model changes.
+
+        The cache is cleared by _apply_updates when objects are added or change
+        type, and also whenever the model's object count or
+        PoolObject._type_changes moves, which covers objects added or updated
+        directly on the model. Each call returns a new list.
+        """
+        generation = (self._model.num_objects, PoolObject._type_changes)
+        if generation != self._by_type_generation:
+            self._by_type_cache.clear()
+            self._by_type_generation = generation
+        key = (obj_type, subtype)
+        matches = self._by_type_cache.get(key)
+        if matches is None:
+            matches = self._by_type_cache[key] = self._model.get_by_type(obj_type, subtype)
+        return list(matches)
+
     def _get_attr_as_int(self, objnam: str, attr: str) -> int | None:
         """Get an attribute value as an integer, or None if unavailable."""
         obj = self._model[objnam]
@@ -1281,6 +1398,16 @@ class ICConnectionHandlerCallbacks(Protocol):
         ...
 
 
+def _full_jitter(delay: int) -> int:
+    """Return a random wait between 0 and delay seconds.
+
+    Clients dropped together (e.g. by a panel reboot) would otherwise all
+    retry on the same schedule; spreading each wait over the whole backoff
+    window keeps them from reconnecting in lockstep.
+    """
+    return random.randint(0, delay)
+
+
 class ICConnectionHandler:
     """Manages automatic reconnection with exponential backoff.
 
@@ -1429,6 +1556,8 @@ class ICConnectionHandler:
                     await asyncio.sleep(CIRCUIT_BREAKER_RESET_TIME)
                     self._failure_count = 0
 
+                # The initial delay is deliberate, so it is not jittered; only
+                # the backoff waits after failed attempts are
                 if initial_delay:
                     self.on_retrying(initial_delay)
                     self._controller._metrics.reconnect_attempts += 1
@@ -1481,8 +1610,9 @@ class ICConnectionHandler:
                     self._failure_count,
                     CIRCUIT_BREAKER_FAILURES,
                 )
-                self.on_retrying(delay)
-                await asyncio.sleep(delay)
+                wait = _full_jitter(delay)
+                self.on_retrying(wait)
+                await asyncio.sleep(wait)
                 delay = min(int(delay * 1.5), MAX_RECONNECT_DELAY)
 
     def _on_disconnect(self, controller: ICBaseController, exc: Exception | None) -> None:
@@ -22,11 +22,16 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
+import time
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from zeroconf import ServiceBrowser, ServiceInfo, Zeroconf
 from zeroconf.asyncio import AsyncZeroconf
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 _LOGGER = logging.getLogger(__name__)
 
 # IntelliCenter service type for mDNS discovery
@@ -36,6 +41,14 @@ INTELLICENTER_SERVICE_NAME_PREFIX = "Pentair"
 # Default discovery timeout
 DEFAULT_DISCOVERY_TIMEOUT = 10.0
 
+# How long discovered units are reused by find_unit_by_name/find_unit_by_host.
+# Units re-announce themselves and rarely change address, so a short TTL
+# saves a full sweep without serving stale results for long.
+DISCOVERY_CACHE_TTL = 30.0
+
+# (time.monotonic() of the sweep, units found) from the last completed discovery
+_discovery_cache: tuple[float, tuple[ICUnit, ...]] | None = None
+
 
 @dataclass(frozen=True)
 class ICUnit:
@@ -254,6 +267,8 @@ async def discover_intellicenter_units(
     Returns:
         List of discovered ICUnit instances
     """
+    global _discovery_cache
+
     # Queue for thread-safe communication between zeroconf callbacks and async code
     queue: asyncio.Queue[tuple[str, str, str]] = asyncio.Queue(maxsize=100)
 
@@ -302,7 +317,10 @@ async def discover_intellicenter_units(
 
         await _process_discovery_queue(queue, listener, aiozc_for_resolution, discovery_timeout)
 
-        return listener.units
+        units = listener.units
+        # Cache an immutable copy so callers can't alter it via the returned list
+        _discovery_cache = (time.monotonic(), tuple(units))
+        return units
 
     finally:
         # Cancel browsers before closing zeroconf
@@ -316,6 +334,26 @@ async def discover_intellicenter_units(
             await aiozc.async_close()
 
 
+def invalidate_discovery_cache() -> None:
+    """Forget previously discovered units.
+
+    The next find_unit_by_name or find_unit_by_host call performs a fresh
+    mDNS sweep.
+    """
+    global _discovery_cache
+    _discovery_cache = None
+
+
+def _cached_units() -> tuple[ICUnit, ...]:
+    """Return the units from the last discovery if it is within the TTL."""
+    if _discovery_cache is None:
+        return ()
+    timestamp, units = _discovery_cache
+    if time.monotonic() - timestamp > DISCOVERY_CACHE_TTL:
+        return ()
+    return units
+
+
 async def find_unit_by_name(
     name: str, discovery_timeout: float = DEFAULT_DISCOVERY_TIMEOUT
 ) -> ICUnit | None:
@@ -325,17 +363,21 @@ async def find_unit_by_name(
         name: Name or partial name to search for (case-insensitive)
         discovery_timeout: How long to wait for discovery
 
+    Units found by a discovery in the last DISCOVERY_CACHE_TTL seconds are
+    checked first; a new sweep is only run when none of them match.
+
     Returns:
         ICUnit if found, None otherwise
     """
-    units = await discover_intellicenter_units(discovery_timeout)
     name_lower = name.lower()
 
-    for unit in units:
-        if name_lower in unit.name.lower():
-            return unit
+    def match(units: Sequence[ICUnit]) -> ICUnit | None:
+        for unit in units:
+            if name_lower in unit.name.lower():
+                return unit
+        return None
 
-    return None
+    return match(_cached_units()) or match(await discover_intellicenter_units(discovery_timeout))
 
 
 async def find_unit_by_host(
@@ -347,13 +389,17 @@ async def find_unit_by_host(
         host: IP address to search for
         discovery_timeout: How long to wait for discovery
 
+    Units found by a discovery in the last DISCOVERY_CACHE_TTL seconds are
+    checked first; a new sweep is only run when none of them match.
+
     Returns:
         ICUnit if found, None otherwise
     """
-    units = await discover_intellicenter_units(discovery_timeout)
 
-    for unit in units:
-        if unit.host == host:
-            return unit
+    def match(units: Sequence[ICUnit]) -> ICUnit | None:
+        for unit in units:
+            if unit.host == host:
+                return unit
+        return None
 
-    return None
+    return match(_cached_units()) or match(await discover_intellicenter_units(discovery_timeout))
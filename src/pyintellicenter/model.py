@@ -8,7 +8,7 @@ view of the IntelliCenter system.
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from .attributes import (
     ALL_ATTRIBUTES_BY_TYPE,
@@ -29,7 +29,8 @@ from .attributes import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, KeysView, ValuesView
+    from collections.abc import Iterator, KeysView, Mapping, ValuesView
+    from collections.abc import Set as AbstractSet
 
     from .types import ObjectEntry
 
@@ -45,6 +46,10 @@ class PoolObject:
 
     __slots__ = ("_objnam", "_objtype", "_subtype", "_properties")
 
+    # Bumped whenever update() changes an object's type or subtype, so type
+    # lookups cached elsewhere can tell they are stale
+    _type_changes: ClassVar[int] = 0
+
     def __init__(self, objnam: str, params: dict[str, Any]) -> None:
         """Initialize from object name and parameters.
 
@@ -167,8 +172,12 @@ class PoolObject:
 
             # Handle type/subtype updates (rare but possible)
             if key == OBJTYP_ATTR:
+                if value != self._objtype:
+                    PoolObject._type_changes += 1
                 self._objtype = value
             elif key == SUBTYP_ATTR:
+                if value != self._subtype:
+                    PoolObject._type_changes += 1
                 self._subtype = value
             else:
                 self._properties[key] = value
@@ -187,7 +196,7 @@ class PoolModel:
 
     def __init__(
         self,
-        attribute_map: dict[str, set[str]] | None = None,
+        attribute_map: Mapping[str, AbstractSet[str]] | None = None,
     ) -> None:
         """Initialize the model.
 
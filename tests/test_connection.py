@@ -1,6 +1,8 @@
 """Tests for pyintellicenter connection module (Protocol-based)."""
 
 import asyncio
+import functools
+import socket
 from types import SimpleNamespace
 from unittest.mock import MagicMock, call, patch
 
@@ -15,6 +17,7 @@ from pyintellicenter.connection import (
     DEFAULT_WEBSOCKET_PORT,
     ICProtocol,
     ICWebSocketTransport,
+    _configure_tcp_socket,
 )
 
 
@@ -242,6 +245,70 @@ class TestICProtocol:
         # Transport should be closed
         mock_transport.close.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_data_received_split_terminator(self):
+        """Test a \\r\\n terminator split across two chunks is still found."""
+        notifications = []
+        protocol = ICProtocol(notification_callback=notifications.append)
+        protocol.connection_made(MagicMock())
+
+        protocol.data_received(b'{"command":"NotifyList","objectList":[]}\r')
+        protocol.data_received(b'\n{"command":"NotifyList"')
+        protocol.data_received(b',"objectList":[]}\r\n')
+
+        await asyncio.sleep(0.01)
+
+        assert len(notifications) == 2
+        assert protocol._buffer == bytearray()
+
+    @pytest.mark.asyncio
+    async def test_data_received_resumes_scan(self):
+        """Test partial data is not rescanned from the start on each chunk."""
+        protocol = ICProtocol()
+        protocol.connection_made(MagicMock())
+
+        protocol.data_received(b'{"command":')
+        assert protocol._scan_pos == len(b'{"command":')
+
+        protocol.data_received(b'"NotifyList"')
+        assert protocol._scan_pos == len(b'{"command":"NotifyList"')
+
+    @pytest.mark.asyncio
+    async def test_data_received_drops_unobserved_notification(self):
+        """Test a NotifyList with no callback or observer is counted but not parsed."""
+        protocol = ICProtocol()
+        protocol.connection_made(MagicMock())
+
+        with patch.object(protocol, "_dispatch_message") as dispatch:
+            protocol.data_received(b'{"command":"NotifyList","objectList":[]}\r\n')
+
+        dispatch.assert_not_called()
+        assert protocol._notification_observer_state.sequence == 1
+
+    @pytest.mark.asyncio
+    async def test_data_received_parses_observed_notification(self):
+        """Test a NotifyList is parsed once an observer is registered."""
+        protocol = ICProtocol()
+        protocol.connection_made(MagicMock())
+        observer = MagicMock()
+        protocol._notification_observer_state.observers.append(observer)
+
+        protocol.data_received(b'{"command":"NotifyList","objectList":[]}\r\n')
+
+        observer.assert_called_once_with(1, {"command": "NotifyList", "objectList": []})
+
+    @pytest.mark.asyncio
+    async def test_data_received_never_drops_response(self):
+        """Test a frame carrying a response is parsed even without listeners."""
+        protocol = ICProtocol()
+        protocol.connection_made(MagicMock())
+        protocol._response_future = asyncio.get_running_loop().create_future()
+        protocol._pending_message_id = "1"
+
+        protocol.data_received(b'{"command":"NotifyList","messageID":"1","response":"200"}\r\n')
+
+        assert protocol._response_future.result()["response"] == "200"
+
     def test_message_id_increments(self):
         """Test message ID increments."""
         protocol = ICProtocol()
@@ -379,6 +446,24 @@ class TestICConnection:
         conn.set_notification_callback(None)
         assert conn._notification_callback is None
 
+    def test_set_notification_callback_resolves_async_on_protocol(self):
+        """Test the live protocol learns once whether the callback is async."""
+        conn = ICConnection("192.168.1.100")
+        conn._protocol = ICProtocol()
+
+        async def async_callback(msg):
+            pass
+
+        conn.set_notification_callback(functools.partial(async_callback))
+        assert conn._protocol._is_async_callback is True
+
+        conn.set_notification_callback(MagicMock())
+        assert conn._protocol._is_async_callback is False
+
+        conn.set_notification_callback(None)
+        assert conn._protocol._notification_callback is None
+        assert conn._protocol._is_async_callback is False
+
     def test_set_disconnect_callback(self):
         """Test setting disconnect callback."""
         conn = ICConnection("192.168.1.100")
@@ -401,6 +486,36 @@ class TestICConnection:
         assert conn.connected is False
 
 
+class TestConfigureTcpSocket:
+    """Tests for the socket options applied to TCP connections."""
+
+    def test_enables_nodelay_and_keepalive(self):
+        """Test Nagle is disabled and keepalive enabled on a real socket."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            _configure_tcp_socket(sock)
+
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+            assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                assert (
+                    sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE)
+                    == connection_module.TCP_KEEPIDLE
+                )
+
+    def test_ignores_missing_socket(self):
+        """Test transports without a socket are left alone."""
+        _configure_tcp_socket(None)
+
+    def test_ignores_unsupported_option(self):
+        """Test an option rejected by the OS does not abort the others."""
+        sock = MagicMock()
+        sock.setsockopt.side_effect = [OSError("unsupported"), None, None, None, None]
+
+        _configure_tcp_socket(sock)
+
+        assert sock.setsockopt.call_count >= 2
+
+
 class TestICResponseError:
     """Tests for ICResponseError exception."""
 
@@ -853,7 +968,7 @@ class TestWriteWatermarks:
         before_values = []
         after_values = []
 
-        def write(_packet):
+        def writelines(_packets):
             events.append("write")
             protocol._handle_response(
                 {
@@ -863,7 +978,7 @@ class TestWriteWatermarks:
                 }
             )
 
-        transport.write.side_effect = write
+        transport.writelines.side_effect = writelines
 
         def before_write(sequence, started_at):
             assert connection._request_lock.locked()
@@ -1033,8 +1148,8 @@ class TestWriteWatermarks:
             transport = MagicMock()
             protocol.connection_made(transport)
 
-            def write(packet):
-                writes.append(packet)
+            def writelines(packets):
+                writes.append(b"".join(packets))
                 protocol._handle_response(
                     {
                         "command": "SendParamList",
@@ -1043,7 +1158,7 @@ class TestWriteWatermarks:
                     }
                 )
 
-            transport.write.side_effect = write
+            transport.writelines.side_effect = writelines
         else:
             protocol = ICWebSocketTransport(
                 notification_observer_state=connection._notification_observer_state,
@@ -16,7 +16,7 @@ from pyintellicenter import (
     ICSystemInfo,
     PoolModel,
 )
-from pyintellicenter.controller import prune
+from pyintellicenter.controller import MAX_ATTRIBUTES_PER_QUERY, _pack_queries, prune
 
 
 class TestPrune:
@@ -54,6 +54,101 @@ class TestPrune:
         assert prune(None) is None
 
 
+class TestPackQueries:
+    """Test _pack_queries batching."""
+
+    @staticmethod
+    def _query(objnam, num_keys):
+        return {"objnam": objnam, "keys": ["K"] * num_keys}
+
+    def test_batches_respect_limit_and_cover_every_query(self):
+        """Every query lands in exactly one batch and no batch exceeds the limit."""
+        queries = [self._query(f"OBJ{i}", size) for i, size in enumerate([30, 20, 25, 10, 15])]
+
+        batches = _pack_queries(queries)
+
+        assert len(batches) == 2  # 100 keys fit exactly into two batches of 50
+        for batch in batches:
+            assert sum(len(q["keys"]) for q in batch) <= MAX_ATTRIBUTES_PER_QUERY
+        covered = sorted(q["objnam"] for batch in batches for q in batch)
+        assert covered == sorted(q["objnam"] for q in queries)
+
+    def test_small_queries_fill_earlier_batches(self):
+        """Small queries fill the room earlier batches left behind."""
+        queries = [
+            self._query("A", 45),
+            self._query("B", 10),
+            self._query("C", 5),
+            self._query("D", 40),
+        ]
+
+        batches = _pack_queries(queries)
+
+        # Flushing once the next query does not fit would need three: [A], [B, C], [D]
+        assert [[q["objnam"] for q in batch] for batch in batches] == [["A", "C"], ["B", "D"]]
+
+    def test_oversized_query_sent_alone(self):
+        """A query larger than the limit gets a batch of its own."""
+        queries = [self._query("BIG", MAX_ATTRIBUTES_PER_QUERY + 10), self._query("A", 5)]
+
+        batches = _pack_queries(queries)
+
+        assert [[q["objnam"] for q in batch] for batch in batches] == [["BIG"], ["A"]]
+
+    def test_empty(self):
+        assert _pack_queries([]) == []
+
+    def test_realistic_install_needs_no_more_batches_than_before(self):
+        """On a realistic object set, packing never adds RequestParamList round trips."""
+        queries = _realistic_model().attributes_to_track()
+
+        batches = _pack_queries(queries)
+
+        assert len(batches) <= len(_flush_before_limit(queries))
+        for batch in batches:
+            assert sum(len(q["keys"]) for q in batch) <= MAX_ATTRIBUTES_PER_QUERY
+
+
+# Object counts per type for a realistic 69-object install
+_REALISTIC_INSTALL = {
+    "SYSTEM": 1,
+    "BODY": 2,
+    "CIRCUIT": 25,
+    "CIRCGRP": 3,
+    "PUMP": 3,
+    "PMPCIRC": 10,
+    "HEATER": 2,
+    "SENSE": 3,
+    "CHEM": 2,
+    "VALVE": 4,
+    "SCHED": 12,
+    "EXTINSTR": 2,
+}
+
+
+def _realistic_model():
+    """Return a PoolModel holding the objects of a realistic install."""
+    model = PoolModel()
+    for objtyp, count in _REALISTIC_INSTALL.items():
+        for i in range(count):
+            model.add_object(f"{objtyp}{i:02d}", {"OBJTYP": objtyp})
+    return model
+
+
+def _flush_before_limit(queries):
+    """Batch queries the way the monitor path did before _pack_queries."""
+    batches, batch, num_attributes = [], [], 0
+    for query in queries:
+        if batch and num_attributes + len(query["keys"]) > MAX_ATTRIBUTES_PER_QUERY:
+            batches.append(batch)
+            batch, num_attributes = [], 0
+        batch.append(query)
+        num_attributes += len(query["keys"])
+    if batch:
+        batches.append(batch)
+    return batches
+
+
 class TestICCommandError:
     """Test ICCommandError exception."""
 
@@ -216,6 +311,14 @@ class TestICConnectionMetrics:
         assert result["reconnect_attempts"] == 5
         assert result["successful_connects"] == 10
 
+    def test_to_dict_covers_every_field(self):
+        """Test to_dict matches dataclasses.asdict, so no field is forgotten."""
+        from dataclasses import asdict
+
+        metrics = ICConnectionMetrics(requests_sent=1, reconnect_attempts=2)
+
+        assert metrics.to_dict() == asdict(metrics)
+
     def test_repr(self):
         """Test repr representation."""
         metrics = ICConnectionMetrics()
@@ -415,6 +518,47 @@ class TestICModelController:
 
         assert model.num_objects >= 1
 
+    @pytest.mark.asyncio
+    async def test_start_batches_subscriptions_up_to_the_limit(self):
+        """start() flushes a batch once it reaches the limit, as it always has.
+
+        Flushing only after reaching MAX_ATTRIBUTES_PER_QUERY lets the query
+        that crosses the limit ride along in the batch, which keeps the
+        round-trip count on a realistic install below what a hard cap needs.
+        """
+        model = _realistic_model()
+        controller = ICModelController("192.168.1.100", model, 6681)
+        queries = model.attributes_to_track()
+        batches: list[list[dict]] = []
+
+        async def fake_send_cmd(cmd, extra=None):
+            assert cmd == "RequestParamList"
+            batches.append(extra["objectList"])
+            return {"objectList": []}
+
+        controller.get_all_objects = AsyncMock(return_value=[])
+        controller.send_cmd = AsyncMock(side_effect=fake_send_cmd)
+        with patch.object(ICBaseController, "start", new=AsyncMock()):
+            await controller.start()
+
+        # 27 batches for 69 objects, fewer than a hard cap at the limit needs
+        assert len(batches) == 27
+        total_keys = sum(len(q["keys"]) for q in queries)
+        assert len(batches) < -(-total_keys // MAX_ATTRIBUTES_PER_QUERY)
+
+        # Each batch stays under the limit until its last query, and every
+        # batch but the final remainder is flushed as soon as it reaches it
+        for batch in batches:
+            keys = [len(q["keys"]) for q in batch]
+            assert sum(keys[:-1]) < MAX_ATTRIBUTES_PER_QUERY
+        for batch in batches[:-1]:
+            assert sum(len(q["keys"]) for q in batch) >= MAX_ATTRIBUTES_PER_QUERY
+
+        # Together the batches subscribe every object exactly once, in order
+        sent = [q for batch in batches for q in batch]
+        assert sent == queries
+        assert sorted(q["objnam"] for q in sent) == sorted(model.objects)
+
     def test_on_notification_updates_model(self, controller, model):
         """Test _on_notification updates the model."""
         # Add object to model
@@ -490,6 +634,78 @@ class TestICModelController:
         assert callback_called
         assert "CIRCUIT1" in received_updates
 
+    @pytest.mark.asyncio
+    async def test_wait_for_attr_change_resolves_on_update(self, controller, model):
+        """wait_for_attr_change resolves with the next value of that attribute."""
+        model.add_object(
+            "CHM01",
+            {"OBJTYP": "CHEM", "SUBTYP": "ICHEM", "SNAME": "IntelliChem", "PHSET": "7.4"},
+        )
+
+        changed = controller.wait_for_attr_change("CHM01", "PHSET")
+        other = controller.wait_for_attr_change("CHM01", "ORPSET")
+
+        controller._on_notification(
+            {
+                "command": "NotifyList",
+                "objectList": [{"objnam": "CHM01", "params": {"PHSET": "7.5"}}],
+            }
+        )
+
+        assert await asyncio.wait_for(changed, 1) == "7.5"
+        assert not other.done()
+        assert ("CHM01", "PHSET") not in controller._attr_waiters
+
+        other.cancel()
+        await asyncio.sleep(0)
+        assert controller._attr_waiters == {}
+
+    @pytest.mark.asyncio
+    async def test_wait_for_attr_change_ignores_unchanged_value(self, controller, model):
+        """An update repeating the current value does not resolve the waiter."""
+        model.add_object(
+            "CHM01",
+            {"OBJTYP": "CHEM", "SUBTYP": "ICHEM", "SNAME": "IntelliChem", "PHSET": "7.4"},
+        )
+
+        changed = controller.wait_for_attr_change("CHM01", "PHSET")
+        controller._on_notification(
+            {
+                "command": "NotifyList",
+                "objectList": [{"objnam": "CHM01", "params": {"PHSET": "7.4"}}],
+            }
+        )
+
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.05):
+                await changed
+        assert controller._attr_waiters == {}
+
+    @pytest.mark.asyncio
+    async def test_wait_for_attr_change_fails_on_stop(self, controller):
+        """Waiters still pending when the controller stops fail instead of hanging."""
+        changed = controller.wait_for_attr_change("CHM01", "PHSET")
+
+        await controller.stop()
+
+        with pytest.raises(ICConnectionError):
+            await changed
+        assert controller._attr_waiters == {}
+
+    @pytest.mark.asyncio
+    async def test_wait_for_attr_change_fails_on_disconnect(self, controller):
+        """Waiters fail when the connection drops, before the disconnect callback runs."""
+        changed = controller.wait_for_attr_change("CHM01", "PHSET")
+        seen = []
+        controller.set_disconnected_callback(lambda ctrl, exc: seen.append(changed.done()))
+
+        controller._on_disconnect(None)
+
+        assert seen == [True]
+        with pytest.raises(ICConnectionError):
+            await changed
+        assert controller._attr_waiters == {}
+
     def test_on_notification_adds_new_object_and_fires_callback(self, controller, model):
         """A NotifyList for a brand-new object adds it and fires the callback.
 
@@ -790,6 +1006,73 @@ class TestICModelController:
         assert len(pumps) == 2
         assert all(obj.objtype == "PUMP" for obj in pumps)
 
+    def test_get_lights(self, controller, model):
+        """Test get_lights lists lights ahead of light shows."""
+        model.add_object("C001", {"OBJTYP": "CIRCUIT", "SUBTYP": "LITSHO", "SNAME": "Show"})
+        model.add_object("C002", {"OBJTYP": "CIRCUIT", "SUBTYP": "INTELLI", "SNAME": "Pool"})
+        model.add_object("C003", {"OBJTYP": "CIRCUIT", "SUBTYP": "GENERIC", "SNAME": "Aux"})
+        model.add_object("C004", {"OBJTYP": "CIRCUIT", "SUBTYP": "DIMMER", "SNAME": "Deck"})
+
+        assert [obj.objnam for obj in controller.get_lights()] == ["C002", "C004", "C001"]
+        assert [obj.objnam for obj in controller.get_lights(include_shows=False)] == [
+            "C002",
+            "C004",
+        ]
+
+    def test_get_by_type_cache_reused(self, controller, model):
+        """Test repeated lookups reuse the cached matches instead of rescanning."""
+        model.add_object("B1", {"OBJTYP": "BODY", "SUBTYP": "POOL", "SNAME": "Pool"})
+
+        with patch.object(model, "get_by_type", wraps=model.get_by_type) as get_by_type:
+            assert len(controller.get_bodies()) == 1
+            assert len(controller.get_bodies()) == 1
+
+        assert get_by_type.call_count == 1
+
+    def test_get_by_type_cache_sees_object_added_by_update(self, controller, model):
+        """Test an object added through _apply_updates shows up in the next lookup."""
+        model.add_object("B1", {"OBJTYP": "BODY", "SUBTYP": "POOL", "SNAME": "Pool"})
+        assert len(controller.get_bodies()) == 1
+
+        controller._apply_updates([{"objnam": "B2", "params": {"OBJTYP": "BODY", "SUBTYP": "SPA"}}])
+
+        assert [obj.objnam for obj in controller.get_bodies()] == ["B1", "B2"]
+
+    def test_get_by_type_cache_sees_subtype_change(self, controller, model):
+        """Test a subtype change through _apply_updates moves the object."""
+        model.add_object("B1", {"OBJTYP": "BODY", "SUBTYP": "SPA", "SNAME": "Spa"})
+        assert [obj.objnam for obj in controller._get_by_type("BODY", "SPA")] == ["B1"]
+
+        controller._apply_updates([{"objnam": "B1", "params": {"SUBTYP": "POOL"}}])
+
+        assert controller._get_by_type("BODY", "SPA") == []
+
+    def test_get_by_type_cache_sees_direct_object_update(self, controller, model):
+        """Test a type change made directly on a PoolObject is not served stale."""
+        model.add_object("B1", {"OBJTYP": "BODY", "SUBTYP": "SPA", "SNAME": "Spa"})
+        assert [obj.objnam for obj in controller._get_by_type("BODY", "SPA")] == ["B1"]
+
+        model["B1"].update({"SUBTYP": "POOL"})
+
+        assert controller._get_by_type("BODY", "SPA") == []
+        assert [obj.objnam for obj in controller._get_by_type("BODY", "POOL")] == ["B1"]
+
+    def test_get_by_type_cache_sees_direct_add(self, controller, model):
+        """Test an object added directly on the model shows up in the next lookup."""
+        assert controller.get_bodies() == []
+
+        model.add_object("B1", {"OBJTYP": "BODY", "SUBTYP": "POOL", "SNAME": "Pool"})
+
+        assert [obj.objnam for obj in controller.get_bodies()] == ["B1"]
+
+    def test_get_by_type_returns_new_list(self, controller, model):
+        """Test mutating a returned list does not affect later lookups."""
+        model.add_object("B1", {"OBJTYP": "BODY", "SUBTYP": "POOL", "SNAME": "Pool"})
+
+        controller.get_bodies().clear()
+
+        assert len(controller.get_bodies()) == 1
+
     def test_get_chem_controllers(self, controller, model):
         """Test get_chem_controllers convenience method."""
         model.add_object("CHEM01", {"OBJTYP": "CHEM", "SUBTYP": "ICHLOR", "SNAME": "Salt Cell"})
@@ -801,6 +1084,33 @@ class TestICModelController:
         assert len(chem) == 2
         assert all(obj.objtype == "CHEM" for obj in chem)
 
+    def test_get_chem_reading(self, controller, model):
+        """Test get_chem_reading is case-insensitive and parses pH as a float."""
+        model.add_object(
+            "CHEM02",
+            {"OBJTYP": "CHEM", "SUBTYP": "ICHEM", "SNAME": "IntelliChem", "PHVAL": "7.4"},
+        )
+        model.process_updates([{"objnam": "CHEM02", "params": {"ORPVAL": "650"}}])
+
+        assert controller.get_chem_reading("CHEM02", "pH") == 7.4
+        assert controller.get_chem_reading("CHEM02", "orp") == 650
+        assert controller.get_chem_reading("CHEM02", "SALT") is None
+        assert controller.get_chem_reading("CHEM02", "BOGUS") is None
+
+    def test_get_chem_alerts(self, controller, model):
+        """Test get_chem_alerts and has_chem_alert report the active alerts."""
+        model.add_object(
+            "CHEM02",
+            {"OBJTYP": "CHEM", "SUBTYP": "ICHEM", "PHHI": "ON", "PHLO": "OFF", "ORPLO": "ON"},
+        )
+        model.add_object("CHEM03", {"OBJTYP": "CHEM", "SUBTYP": "ICHEM", "PHHI": "OFF"})
+
+        assert controller.get_chem_alerts("CHEM02") == ["pH High", "ORP Low"]
+        assert controller.has_chem_alert("CHEM02") is True
+        assert controller.get_chem_alerts("CHEM03") == []
+        assert controller.has_chem_alert("CHEM03") is False
+        assert controller.has_chem_alert("MISSING") is False
+
     @pytest.mark.asyncio
     async def test_set_multiple_circuit_states(self, controller):
         """Test set_multiple_circuit_states convenience method."""
@@ -13,9 +13,22 @@ from pyintellicenter.discovery import (
     discover_intellicenter_units,
     find_unit_by_host,
     find_unit_by_name,
+    invalidate_discovery_cache,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_discovery_cache():
+    """Start and end every test with an empty discovery cache.
+
+    The cache is module-global, so without this the find_unit_by_* tests
+    would depend on units left behind by whichever test ran before them.
+    """
+    invalidate_discovery_cache()
+    yield
+    invalidate_discovery_cache()
+
+
 class TestICUnit:
     """Test ICUnit dataclass."""
 
@@ -327,6 +340,94 @@ class TestFindUnitByHost:
             assert unit is None
 
 
+class TestDiscoveryCache:
+    """Test reuse of discovered units by the find_unit_by_* helpers."""
+
+    @staticmethod
+    def _patch_discovery(units):
+        """Run the real discovery with a listener that reports the given units."""
+        mock_aiozc = MagicMock()
+        mock_aiozc.zeroconf = MagicMock()
+        mock_aiozc.async_close = AsyncMock()
+
+        async def process_queue(queue, listener, aiozc, discovery_timeout):
+            for unit in units:
+                listener.add_unit(unit.name, unit)
+
+        return (
+            patch("pyintellicenter.discovery.AsyncZeroconf", return_value=mock_aiozc),
+            patch("pyintellicenter.discovery.ServiceBrowser"),
+            patch(
+                "pyintellicenter.discovery._process_discovery_queue",
+                side_effect=process_queue,
+            ),
+        )
+
+    @pytest.mark.asyncio
+    async def test_find_uses_cached_units(self):
+        """Test find_unit_by_* reuse units from a recent discovery."""
+        pool = ICUnit(name="Pentair Pool", host="192.168.1.100", port=6681, ws_port=6680)
+        zc_patch, browser_patch, queue_patch = self._patch_discovery([pool])
+
+        with zc_patch, browser_patch, queue_patch as process_queue:
+            await discover_intellicenter_units(discovery_timeout=0.1)
+
+            assert await find_unit_by_host("192.168.1.100") == pool
+            assert await find_unit_by_name("pool") == pool
+            assert process_queue.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_unaffected_by_mutating_result(self):
+        """Test changes to the returned list do not leak into the cache."""
+        pool = ICUnit(name="Pentair Pool", host="192.168.1.100", port=6681, ws_port=6680)
+        zc_patch, browser_patch, queue_patch = self._patch_discovery([pool])
+
+        with zc_patch, browser_patch, queue_patch as process_queue:
+            units = await discover_intellicenter_units(discovery_timeout=0.1)
+            units.clear()
+
+            assert await find_unit_by_host("192.168.1.100") == pool
+            assert process_queue.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_find_rescans_on_cache_miss(self):
+        """Test a unit not in the cache triggers a new discovery."""
+        pool = ICUnit(name="Pentair Pool", host="192.168.1.100", port=6681, ws_port=6680)
+        zc_patch, browser_patch, queue_patch = self._patch_discovery([pool])
+
+        with zc_patch, browser_patch, queue_patch as process_queue:
+            await discover_intellicenter_units(discovery_timeout=0.1)
+
+            assert await find_unit_by_host("192.168.1.200") is None
+            assert process_queue.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_find_ignores_expired_cache(self):
+        """Test cached units are not used once the TTL has passed."""
+        pool = ICUnit(name="Pentair Pool", host="192.168.1.100", port=6681, ws_port=6680)
+        zc_patch, browser_patch, queue_patch = self._patch_discovery([pool])
+
+        with zc_patch, browser_patch, queue_patch as process_queue:
+            await discover_intellicenter_units(discovery_timeout=0.1)
+
+            with patch("pyintellicenter.discovery.DISCOVERY_CACHE_TTL", -1.0):
+                assert await find_unit_by_host("192.168.1.100") == pool
+            assert process_queue.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_discovery_cache(self):
+        """Test invalidating the cache forces a new discovery."""
+        pool = ICUnit(name="Pentair Pool", host="192.168.1.100", port=6681, ws_port=6680)
+        zc_patch, browser_patch, queue_patch = self._patch_discovery([pool])
+
+        with zc_patch, browser_patch, queue_patch as process_queue:
+            await discover_intellicenter_units(discovery_timeout=0.1)
+            invalidate_discovery_cache()
+
+            assert await find_unit_by_name("Pentair") == pool
+            assert process_queue.call_count == 2
+
+
 class TestDefaultTimeout:
     """Test default discovery timeout."""
 
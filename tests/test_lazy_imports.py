@@ -0,0 +1,70 @@
+"""Tests for the lazily imported top-level exports.
+
+``pyintellicenter/__init__.py`` resolves the connection, controller, model and
+discovery names on first access (PEP 562) so that importing the attribute
+constants does not pull in asyncio networking, orjson, websockets or zeroconf.
+These tests pin that the public surface is unchanged by the deferral.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+_SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+class TestLazyImports:
+    """Pin the lazy-export contract of the top-level package."""
+
+    def test_import_does_not_load_networking(self) -> None:
+        """Importing the package must not import the controller or its dependencies."""
+        code = (
+            "import sys, pyintellicenter\n"
+            "from pyintellicenter import PHSET_ATTR, ICError\n"
+            "loaded = [m for m in ('pyintellicenter.controller', 'pyintellicenter.connection',"
+            " 'pyintellicenter.discovery', 'orjson', 'websockets', 'zeroconf')"
+            " if m in sys.modules]\n"
+            "print(','.join(loaded))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={"PYTHONPATH": str(_SRC)},
+        )
+
+        assert result.stdout.strip() == ""
+
+    def test_all_exports_resolve(self) -> None:
+        """Every name in ``__all__`` must be reachable from the package."""
+        import pyintellicenter
+
+        for name in pyintellicenter.__all__:
+            assert getattr(pyintellicenter, name) is not None, name
+
+    def test_lazy_export_is_submodule_object(self) -> None:
+        """A lazily exported name must be the submodule's own object."""
+        import pyintellicenter
+        from pyintellicenter import controller, model
+
+        assert pyintellicenter.ICModelController is controller.ICModelController
+        assert pyintellicenter.PoolModel is model.PoolModel
+
+    def test_lazy_exports_listed_in_dir(self) -> None:
+        """``dir()`` must include names that have not been loaded yet."""
+        import pyintellicenter
+
+        assert "ICBaseController" in dir(pyintellicenter)
+        assert "PoolObject" in dir(pyintellicenter)
+
+    def test_unknown_name_raises_attribute_error(self) -> None:
+        """Unknown names must still raise ``AttributeError``."""
+        import pyintellicenter
+
+        with pytest.raises(AttributeError, match="NotAnExport"):
+            pyintellicenter.NotAnExport  # noqa: B018
@@ -10,6 +10,8 @@ style as ``tests/test_controller.py`` (a ``PoolModel`` fixture populated via
 import pytest
 
 from pyintellicenter import (
+    BodyState,
+    HeaterType,
     ICModelController,
     PoolModel,
 )
@@ -174,6 +176,69 @@ class TestBodyLastTemperatureAndHeater:
         assert controller.get_heater_for_body("NONEXISTENT") is None
 
 
+class TestBodyState:
+    """Test get_body_state()."""
+
+    def test_get_body_state(self, controller, model):
+        """Test the combined state matches the single-value getters."""
+        model.add_object(
+            "B1101",
+            {
+                "OBJTYP": "BODY",
+                "TEMP": "82",
+                "LOTMP": "86",
+                "HITMP": "90",
+                "MODE": "1",
+                "HTMODE": "1",
+                "HEATER": "H0001",
+            },
+        )
+        model.add_object("H0001", {"OBJTYP": "HEATER", "COOL": "OFF"})
+
+        assert controller.get_body_state("B1101") == BodyState(
+            temperature=82,
+            heating_setpoint=86,
+            cooling_setpoint=90,
+            heat_mode=HeaterType(1),
+            heating=True,
+            cooling=False,
+        )
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"TEMP": "", "LOTMP": "abc", "MODE": "99", "HTMODE": "0", "HEATER": "00000"},
+            {"TEMP": "78", "MODE": "0", "HEATER": "H0001"},
+            {"HITMP": "92", "MODE": "x", "HTMODE": "2", "HEATER": "H0002"},
+            {},
+        ],
+    )
+    def test_get_body_state_matches_getters(self, controller, model, params):
+        """Test the combined state agrees with the single-value getters."""
+        model.add_object("B1101", {"OBJTYP": "BODY", **params})
+        model.add_object("H0001", {"OBJTYP": "HEATER", "COOL": "ON"})
+
+        assert controller.get_body_state("B1101") == BodyState(
+            temperature=controller.get_body_temperature("B1101"),
+            heating_setpoint=controller.get_body_heating_setpoint("B1101"),
+            cooling_setpoint=controller.get_body_cooling_setpoint("B1101"),
+            heat_mode=controller.get_body_heat_mode("B1101"),
+            heating=controller.is_body_heating("B1101"),
+            cooling=controller.is_body_cooling("B1101"),
+        )
+
+    def test_get_body_state_unknown_body(self, controller):
+        """Test an unknown body reports no values and no activity."""
+        assert controller.get_body_state("NONEXISTENT") == BodyState(
+            temperature=None,
+            heating_setpoint=None,
+            cooling_setpoint=None,
+            heat_mode=None,
+            heating=False,
+            cooling=False,
+        )
+
+
 class TestIsBodyCoolingAfterRefactor:
     """Verify is_body_cooling still behaves after the get_heater_for_body de-dup."""
 
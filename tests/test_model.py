@@ -551,3 +551,26 @@ class TestPoolModel:
         assert model["VALID1"] is not None
         assert model["_FDR"] is None
         assert model["VALID2"] is not None
+
+
+class TestAttributeSets:
+    """Tests for the per-type attribute whitelists."""
+
+    def test_attribute_sets_are_frozen(self):
+        """Every tracked attribute set is an immutable frozenset."""
+        from pyintellicenter.attributes import ALL_ATTRIBUTES_BY_TYPE
+
+        for objtype, attributes in ALL_ATTRIBUTES_BY_TYPE.items():
+            assert isinstance(attributes, frozenset), objtype
+
+    def test_attr_to_types_inverts_attribute_map(self):
+        """ATTR_TO_TYPES lists, in sorted order, every type tracking an attribute."""
+        from pyintellicenter.attributes import ALL_ATTRIBUTES_BY_TYPE, ATTR_TO_TYPES
+
+        for attr, objtypes in ATTR_TO_TYPES.items():
+            assert objtypes == tuple(
+                sorted(t for t, attrs in ALL_ATTRIBUTES_BY_TYPE.items() if attr in attrs)
+            )
+        for objtype, attrs in ALL_ATTRIBUTES_BY_TYPE.items():
+            for attr in attrs:
+                assert objtype in ATTR_TO_TYPES[attr]
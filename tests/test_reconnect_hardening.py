@@ -42,6 +42,59 @@ class TestStarterStopRecheck:
         controller.start.assert_not_called()
 
 
+class TestStarterJitter:
+    """Reconnect waits are spread over the whole backoff window."""
+
+    @pytest.mark.asyncio
+    async def test_waits_are_jittered_within_growing_window(self):
+        controller = MagicMock()
+        controller.start = AsyncMock(
+            side_effect=[ICConnectionError("refused"), ICConnectionError("refused"), None]
+        )
+        controller._metrics = ICConnectionMetrics()
+        controller.set_disconnected_callback = MagicMock()
+
+        handler = ICConnectionHandler(controller, time_between_reconnects=30)
+        retries: list[int] = []
+        handler.on_retrying = retries.append  # type: ignore[method-assign]
+        windows: list[int] = []
+
+        def fake_randint(low: int, high: int) -> int:
+            windows.append(high)
+            return high // 2
+
+        with (
+            patch("asyncio.sleep", new=AsyncMock()) as sleep,
+            patch("pyintellicenter.controller.random.randint", new=fake_randint),
+        ):
+            await handler._starter(initial_delay=30)
+
+        # The initial delay is waited in full; after each failure the window
+        # still grows 1.5x and the wait is drawn from it
+        assert windows == [30, 45]
+        assert retries == [30, 15, 22]
+        assert [c.args[0] for c in sleep.await_args_list] == [30, 15, 22]
+
+    @pytest.mark.asyncio
+    async def test_initial_delay_is_never_shortened(self):
+        """Even when the jitter draws zero, the initial delay is waited in full."""
+        controller = MagicMock()
+        controller.start = AsyncMock()
+        controller._metrics = ICConnectionMetrics()
+        controller.set_disconnected_callback = MagicMock()
+
+        handler = ICConnectionHandler(controller, time_between_reconnects=30)
+
+        with (
+            patch("asyncio.sleep", new=AsyncMock()) as sleep,
+            patch("pyintellicenter.controller.random.randint", return_value=0),
+        ):
+            await handler._starter(initial_delay=30)
+
+        assert [c.args[0] for c in sleep.await_args_list] == [30]
+        controller.start.assert_awaited_once()
+
+
 class TestConnectionReplacement:
     """ICBaseController.start() must not leak or confuse replaced connections."""
 
@@ -174,3 +227,55 @@ class TestKeepaliveMissPolicy:
 
         assert conn.send_request.await_count == 1
         protocol.close.assert_called_once()
+
+
+class TestKeepaliveIdleSkip:
+    """A keepalive is only sent once the link has been idle for an interval."""
+
+    def _connection_with_fake_clock(self) -> tuple[ICConnection, list[float], list[float]]:
+        conn = ICConnection("192.168.1.100", 6681, keepalive_interval=90.0)
+        protocol = MagicMock()
+        protocol.connected = True
+        conn._protocol = protocol
+        conn.send_request = AsyncMock(side_effect=ICConnectionError("Not connected"))
+        return conn, [1000.0], []
+
+    @pytest.mark.asyncio
+    async def test_answered_request_defers_keepalive(self):
+        conn, clock, delays = self._connection_with_fake_clock()
+
+        async def fake_sleep(delay: float) -> None:
+            delays.append(delay)
+            clock[0] += delay
+            if len(delays) == 1:
+                conn._last_activity = clock[0] - 30.0  # a request answered 30 s ago
+
+        with (
+            patch("asyncio.sleep", new=fake_sleep),
+            patch("pyintellicenter.connection.time.monotonic", new=lambda: clock[0]),
+        ):
+            await conn._keepalive_loop()
+
+        # The first tick is skipped and the next one lands a full interval
+        # after the last activity
+        assert delays == [90.0, 60.0]
+        assert conn.send_request.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_notification_defers_keepalive(self):
+        conn, clock, delays = self._connection_with_fake_clock()
+
+        async def fake_sleep(delay: float) -> None:
+            delays.append(delay)
+            clock[0] += delay
+            if len(delays) == 1:
+                conn._notification_observer_state.sequence += 1
+
+        with (
+            patch("asyncio.sleep", new=fake_sleep),
+            patch("pyintellicenter.connection.time.monotonic", new=lambda: clock[0]),
+        ):
+            await conn._keepalive_loop()
+
+        assert delays == [90.0, 90.0]
+        assert conn.send_request.await_count == 1
@@ -0,0 +1,56 @@
+"""Tests for helpers in the diagnostic scripts."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
+
+
+@pytest.fixture(scope="module")
+def find_smart_valves():
+    """Import scripts/find_smart_valves.py the way it runs, with scripts/ on the path."""
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    try:
+        import find_smart_valves
+
+        yield find_smart_valves
+    finally:
+        sys.path.remove(str(SCRIPTS_DIR))
+
+
+class TestSearchForValves:
+    """Tests for the valve search in find_smart_valves."""
+
+    def test_matches_in_preorder(self, find_smart_valves):
+        """Matches come out in the order a recursive depth-first walk prints them."""
+        hardware = {
+            "answer": [
+                {
+                    "objnam": "B1101",
+                    "params": {
+                        "VALVE": "V01",
+                        "OBJLIST": [{"params": {"INTAKE": "I1", "SPILL": "S1"}}],
+                        "RETURN": "R1",
+                    },
+                },
+                {"objnam": "VAL01", "params": {"VALVE": "V02"}},
+            ],
+            "spillway": {"return": {"intake": "I2"}},
+        }
+
+        assert find_smart_valves._search_for_valves(hardware) == [
+            ".answer[0].params.VALVE = 'V01'",
+            ".answer[0].params.OBJLIST[0].params.INTAKE = 'I1'",
+            ".answer[0].params.OBJLIST[0].params.SPILL = 'S1'",
+            ".answer[0].params.RETURN = 'R1'",
+            ".answer[1].params.VALVE = 'V02'",
+            ".spillway = {'return': {'intake': 'I2'}}",
+            ".spillway.return = {'intake': 'I2'}",
+            ".spillway.return.intake = 'I2'",
+        ]
+
+    def test_no_matches(self, find_smart_valves):
+        """Data without valve-related keys yields nothing."""
+        assert find_smart_valves._search_for_valves({"a": [1, {"b": 2}], "c": "valve"}) == []